@@ -6,7 +6,7 @@
 import { useEffect, useRef, useState } from 'react';
 import { Box, CircularProgress, Typography, Alert } from '@mui/material';
 import { ClientSidePoseDetector, PoseResults } from '../services/poseDetection';
-import { ExerciseMetricsCalculator, ExerciseConfig } from '../services/exerciseMetricsCalculator';
+import { ExerciseMetricsCalculator, ExerciseConfig, ExerciseMetrics } from '../services/exerciseMetricsCalculator';
 import { getExercise } from '../services/exerciseConfig';
 import api from '../services/api';
 
@@ -22,6 +22,10 @@ interface ClientSideVideoFeedProps {
   showAdvancedMode?: boolean;
 }
 
+// Position flags packed into one code, so an unchanged frame is a single comparison
+const POSITION_AT_START = 1;
+const POSITION_AT_REP = 2;
+
 const ClientSideVideoFeed: React.FC<ClientSideVideoFeedProps> = ({
   exerciseId,
   onMetricsUpdate,
@@ -44,16 +48,15 @@ const ClientSideVideoFeed: React.FC<ClientSideVideoFeedProps> = ({
   // Rep counting state
   const [atStartingPosition, setAtStartingPosition] = useState(false);
   const [atRepPosition, setAtRepPosition] = useState(false);
-  const [currentMetrics, setCurrentMetrics] = useState<any>(null);
 
   // FPS calculation
-  const fpsCounterRef = useRef({ frames: 0, lastTime: Date.now() });
+  const fpsCounterRef = useRef({ frames: 0, lastTime: performance.now() });
   
   // Rep counting refs (to avoid stale state in callbacks)
-  const prevAtRepPositionRef = useRef(false);
+  const positionStateRef = useRef(0);
   const calculatorRef = useRef<ExerciseMetricsCalculator | null>(null);
   const exerciseConfigRef = useRef<ExerciseConfig | null>(null);
-  const repPositionMetricsRef = useRef<any>(null);
+  const repPositionMetricsRef = useRef<ExerciseMetrics | null>(null);
 
   useEffect(() => {
     let mounted = true;
@@ -86,155 +89,90 @@ const ClientSideVideoFeed: React.FC<ClientSideVideoFeedProps> = ({
 
         // Create pose detector
         const det = new ClientSidePoseDetector({
-          modelComplexity: 1,
           smoothLandmarks: true,
           minDetectionConfidence: 0.5,
           minTrackingConfidence: 0.5,
           showAdvancedMode
         });
+        // Load the model while the camera or video file is starting up
+        det.warmUp();
 
         if (!mounted) return;
 
+        // Shared per-frame handler for both video file and webcam sources
+        const sourceTag = videoFile ? '[VIDEO]' : '[WEBCAM]';
+        const handlePoseResults = (results: PoseResults | null) => {
+          if (!mounted || !calc) return;
+
+          // Update FPS counter (monotonic clock, so wall-clock adjustments cannot skew it)
+          const counter = fpsCounterRef.current;
+          counter.frames++;
+          const now = performance.now();
+          if (now - counter.lastTime >= 1000) {
+            setFps(counter.frames);
+            counter.frames = 0;
+            counter.lastTime = now;
+          }
+
+          if (!results) return;
+
+          // Calculate metrics and check positions for rep counting in one pass.
+          // Position flags only change on transitions, so these setters do not
+          // re-render the feed every frame; live metric values go to the parent.
+          const { metrics, isAtStart, isAtRep } = calc.evaluateFrame(results.landmarks);
+
+          // Compare against the previous frame's position (using ref to avoid stale state)
+          const positionState = (isAtStart ? POSITION_AT_START : 0) | (isAtRep ? POSITION_AT_REP : 0);
+          const prevPositionState = positionStateRef.current;
+          positionStateRef.current = positionState;
+
+          if (positionState !== prevPositionState) {
+            setAtStartingPosition(isAtStart);
+            setAtRepPosition(isAtRep);
+          }
+          
+          // Store metrics while at rep position for quality assessment
+          if (isAtRep) {
+            repPositionMetricsRef.current = metrics;
+          }
+          
+          // Determine and pass current instruction
+          const currentInstruction = getCurrentInstruction(isAtStart, isAtRep);
+          // Clear quality feedback when back at starting position (ready for next rep)
+          const clearQuality = isAtStart && !isAtRep;
+          onMetricsUpdate({ ...metrics, current_instruction: currentInstruction, clear_quality: clearQuality });
+
+          // Detect rep completion
+          const wasAtRep = (prevPositionState & POSITION_AT_REP) !== 0;
+
+          // Nothing below applies unless the rep position changed this frame
+          if (wasAtRep === isAtRep) return;
+
+          // Count rep when leaving rep position (but not during rest period or if workout complete)
+          if (wasAtRep) {
+            if (inRestPeriod) {
+              console.log(`[ClientSideVideoFeed] ${sourceTag} Rep detected but skipped (in rest period)`);
+            } else if (workoutComplete) {
+              console.log(`[ClientSideVideoFeed] ${sourceTag} Rep detected but skipped (workout complete)`);
+            } else {
+              console.log(`[ClientSideVideoFeed] ${sourceTag} Rep completed! Left rep position`);
+              // Use stored metrics from when we were at rep position
+              handleRepComplete(repPositionMetricsRef.current || metrics);
+            }
+          }
+
+          // Log position changes for debugging
+          console.log(`[ClientSideVideoFeed] ${sourceTag} Rep position changed:`, wasAtRep, '->', isAtRep, 'Start:', isAtStart);
+          console.log(`[ClientSideVideoFeed] ${sourceTag} Metrics:`, metrics);
+        };
+
         // Start detection from video file or webcam
         if (canvasRef.current) {
           if (videoFile) {
             console.log('[ClientSideVideoFeed] Starting with VIDEO FILE:', videoFile.name, videoFile.size, 'bytes');
-            await det.startFromVideoFile(videoFile, canvasRef.current, (results: PoseResults | null) => {
-              if (!mounted || !calc) return;
-
-              // Update FPS counter
-              const counter = fpsCounterRef.current;
-              counter.frames++;
-              const now = Date.now();
-              if (now - counter.lastTime >= 1000) {
-                setFps(counter.frames);
-                counter.frames = 0;
-                counter.lastTime = now;
-              }
-
-              if (!results) return;
-
-              // Calculate metrics from landmarks
-              const metrics = calc.calculateMetrics(results.landmarks);
-              setCurrentMetrics(metrics);
-              
-              // Check positions for rep counting
-              const isAtStart = calc.isAtStartingPosition(metrics);
-              const isAtRep = calc.isAtRepPosition(metrics);
-
-              setAtStartingPosition(isAtStart);
-              setAtRepPosition(isAtRep);
-              
-              // Store metrics while at rep position for quality assessment
-              if (isAtRep) {
-                repPositionMetricsRef.current = metrics;
-              }
-              
-              // Determine and pass current instruction
-              const currentInstruction = getCurrentInstruction(isAtStart, isAtRep);
-              // Clear quality feedback when back at starting position (ready for next rep)
-              const clearQuality = isAtStart && !isAtRep;
-              onMetricsUpdate({ ...metrics, current_instruction: currentInstruction, clear_quality: clearQuality });
-
-              // Detect rep completion (using ref to avoid stale state)
-              const wasAtRep = prevAtRepPositionRef.current;
-              
-              // Count rep when leaving rep position (but not during rest period or if workout complete)
-              if (wasAtRep && !isAtRep && !inRestPeriod && !workoutComplete) {
-                console.log('[ClientSideVideoFeed] [VIDEO] Rep completed! Left rep position');
-                // Use stored metrics from when we were at rep position
-                handleRepComplete(repPositionMetricsRef.current || metrics);
-              }
-              
-              // Log if rep was skipped due to rest period
-              if (wasAtRep && !isAtRep && inRestPeriod) {
-                console.log('[ClientSideVideoFeed] [VIDEO] Rep detected but skipped (in rest period)');
-              }
-              
-              // Log if rep was skipped due to workout completion
-              if (wasAtRep && !isAtRep && workoutComplete) {
-                console.log('[ClientSideVideoFeed] [VIDEO] Rep detected but skipped (workout complete)');
-              }
-              
-              // Log position changes for debugging with metrics
-              if (wasAtRep !== isAtRep) {
-                console.log('[ClientSideVideoFeed] [VIDEO] Rep position changed:', wasAtRep, '->', isAtRep, 'Start:', isAtStart);
-                console.log('[ClientSideVideoFeed] [VIDEO] Metrics:', {
-                  knee_angle_degrees: metrics.knee_angle?.toFixed(1) + '°',
-                  squat_depth_normalized: metrics.squat_depth?.toFixed(3),
-                  squat_depth_threshold_rep: '< 0.15',
-                  squat_depth_threshold_start: '> 0.18'
-                });
-              }
-
-              prevAtRepPositionRef.current = isAtRep;
-            });
+            await det.startFromVideoFile(videoFile, canvasRef.current, handlePoseResults);
           } else {
-            await det.startFromWebcam(canvasRef.current, (results: PoseResults | null) => {
-              if (!mounted || !calc) return;
-
-              // Update FPS counter
-              const counter = fpsCounterRef.current;
-              counter.frames++;
-              const now = Date.now();
-              if (now - counter.lastTime >= 1000) {
-                setFps(counter.frames);
-                counter.frames = 0;
-                counter.lastTime = now;
-              }
-
-              if (!results) return;
-
-              // Calculate metrics from landmarks
-              const metrics = calc.calculateMetrics(results.landmarks);
-              setCurrentMetrics(metrics);
-              
-              // Check positions for rep counting
-              const isAtStart = calc.isAtStartingPosition(metrics);
-              const isAtRep = calc.isAtRepPosition(metrics);
-
-              setAtStartingPosition(isAtStart);
-              setAtRepPosition(isAtRep);
-              
-              // Store metrics while at rep position for quality assessment
-              if (isAtRep) {
-                repPositionMetricsRef.current = metrics;
-              }
-              
-              // Determine and pass current instruction
-              const currentInstruction = getCurrentInstruction(isAtStart, isAtRep);
-              // Clear quality feedback when back at starting position (ready for next rep)
-              const clearQuality = isAtStart && !isAtRep;
-              onMetricsUpdate({ ...metrics, current_instruction: currentInstruction, clear_quality: clearQuality });
-
-              // Detect rep completion (using ref to avoid stale state)
-              const wasAtRep = prevAtRepPositionRef.current;
-              
-              // Count rep when leaving rep position (but not during rest period or if workout complete)
-              if (wasAtRep && !isAtRep && !inRestPeriod && !workoutComplete) {
-                console.log('[ClientSideVideoFeed] [WEBCAM] Rep completed! Left rep position');
-                // Use stored metrics from when we were at rep position
-                handleRepComplete(repPositionMetricsRef.current || metrics);
-              }
-              
-              // Log if rep was skipped due to rest period
-              if (wasAtRep && !isAtRep && inRestPeriod) {
-                console.log('[ClientSideVideoFeed] [WEBCAM] Rep detected but skipped (in rest period)');
-              }
-              
-              // Log if rep was skipped due to workout completion
-              if (wasAtRep && !isAtRep && workoutComplete) {
-                console.log('[ClientSideVideoFeed] [WEBCAM] Rep detected but skipped (workout complete)');
-              }
-              
-              // Log position changes for debugging
-              if (wasAtRep !== isAtRep) {
-                console.log('[ClientSideVideoFeed] [WEBCAM] Rep position changed:', wasAtRep, '->', isAtRep, 'Start:', isAtStart);
-                console.log('[ClientSideVideoFeed] [WEBCAM] Metrics:', metrics);
-              }
-
-              prevAtRepPositionRef.current = isAtRep;
-            });
+            await det.startFromWebcam(canvasRef.current, handlePoseResults);
           }
 
           detectorInstance = det;
@@ -296,15 +234,18 @@ const ClientSideVideoFeed: React.FC<ClientSideVideoFeedProps> = ({
         timestamp: Date.now()
       };
 
-      // Log rep to session
-      await api.logRepV2(sessionId, metrics, repData.quality);
-
       // Call parent callback to update UI
       console.log('[ClientSideVideoFeed] Calling onRepComplete with:', repData);
       onRepComplete(repData);
-      console.log('[ClientSideVideoFeed] Rep processing complete');
+
+      // Log rep to session in the background so the UI does not wait on IndexedDB;
+      // writes for the same session are applied in order by IndexedDB, and
+      // completeSessionV2 waits for any still in flight
+      api.logRepV2(sessionId, metrics, repData.quality)
+        .then(() => console.log('[ClientSideVideoFeed] Rep processing complete'))
+        .catch((err) => console.error('[ClientSideVideoFeed] Error logging rep:', err));
     } catch (err) {
-      console.error('[ClientSideVideoFeed] Error logging rep:', err);
+      console.error('[ClientSideVideoFeed] Error validating rep:', err);
       
       // Still call onRepComplete even if backend fails
       const repData = {
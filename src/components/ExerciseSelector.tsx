@@ -14,7 +14,6 @@ import {
   ToggleButtonGroup,
   ToggleButton,
   Alert,
-  Divider,
   IconButton,
   List,
   ListItem,
@@ -6,10 +6,6 @@ import {
   Typography,
   Grid,
   Box,
-  Divider,
-  List,
-  ListItem,
-  ListItemText,
   Alert,
   IconButton,
 } from '@mui/material';
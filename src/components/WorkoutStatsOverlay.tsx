@@ -1,5 +1,5 @@
 import React, { memo } from 'react';
-import { Box, Typography, LinearProgress, Chip, Paper, Grid } from '@mui/material';
+import { Box, Typography, LinearProgress, Chip, Grid } from '@mui/material';
 import FitnessCenterIcon from '@mui/icons-material/FitnessCenter';
 import TimerIcon from '@mui/icons-material/Timer';
 import RepeatIcon from '@mui/icons-material/Repeat';
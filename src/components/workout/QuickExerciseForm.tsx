@@ -2,7 +2,6 @@ import { SyntheticEvent, ChangeEvent } from 'react';
 import { Box, Typography, Autocomplete, TextField, Grid, Button, Collapse } from '@mui/material';
 import AddIcon from '@mui/icons-material/Add';
 import type { Exercise } from '../../types';
-import { DEFAULT_WORKOUT } from '../../constants';
 
 interface QuickExerciseFormProps {
   exercises: Exercise[];
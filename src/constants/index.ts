@@ -51,4 +51,5 @@ export const STORAGE_KEYS = {
 export const TIME = {
   THIRTY_DAYS_MS: 30 * 24 * 60 * 60 * 1000,
   ONE_SECOND_MS: 1000,
+  LIVE_METRICS_REFRESH_MS: 100,
 } as const;
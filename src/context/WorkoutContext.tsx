@@ -1,7 +1,8 @@
-import React, { createContext, useContext, useState, useEffect, ReactNode } from 'react';
+import React, { createContext, useContext, useState, useEffect, useRef, ReactNode } from 'react';
 import api from '../services/api';
 import type { Exercise, WorkoutStats, WorkoutOptions, UploadResults } from '../types';
 import { useTextToSpeech } from '../hooks/useTextToSpeech';
+import { TIME } from '../constants';
 
 interface WorkoutContextValue {
   exercises: Exercise[];
@@ -64,59 +65,66 @@ export const WorkoutProvider: React.FC<WorkoutProviderProps> = ({ children }) =>
   const [loading, setLoading] = useState<boolean>(false);
   const [selectedVideoFile, setSelectedVideoFile] = useState<File | null>(null);
   const [startTime, setStartTime] = useState<number>(0);
+  const lastMetricsRefreshRef = useRef<number>(-Infinity);
+  // Latest metrics held back by the throttle, flushed once the refresh interval elapses
+  const pendingMetricsRef = useRef<any>(null);
+  const metricsFlushTimerRef = useRef<ReturnType<typeof setTimeout> | null>(null);
 
   // Load available exercises on mount
   useEffect(() => {
     loadExercises();
+    return () => cancelPendingMetrics();
   }, []);
 
-  // Update duration timer
-  useEffect(() => {
-    let interval: NodeJS.Timeout;
-    if (isTracking && startTime > 0 && !stats.workout_complete) {
-      interval = setInterval(() => {
-        setStats(prev => ({
-          ...prev,
-          duration: Math.floor((Date.now() - startTime) / 1000)
-        }));
-      }, 1000);
-    }
-    return () => {
-      if (interval) clearInterval(interval);
-    };
-  }, [isTracking, startTime, stats.workout_complete]);
+  // Single 1s ticker for both the session clock and the rest countdown, so
+  // each tick produces one stats update instead of one per timer
+  const clockRunning = isTracking && startTime > 0 && !stats.workout_complete;
+  const inRestPeriod = !!stats.in_rest_period;
 
-  // Rest timer - counts down and ends rest period when complete
   useEffect(() => {
-    if (!stats.in_rest_period) return;
+    if (!clockRunning && !inRestPeriod) return;
 
-    console.log('[WorkoutContext] Rest period started:', stats.rest_remaining, 'seconds');
-    
-    const timer = setInterval(() => {
+    if (inRestPeriod) {
+      console.log('[WorkoutContext] Rest period started:', stats.rest_remaining, 'seconds');
+    }
+
+    const interval = setInterval(() => {
       setStats(prev => {
-        if (!prev.in_rest_period) return prev;
-        
-        const remaining = (prev.rest_remaining || 1) - 1;
-        
-        if (remaining <= 0) {
-          // Rest complete - ready for next set
-          console.log('[WorkoutContext] Rest complete - ready for next set');
-          return {
-            ...prev,
-            in_rest_period: false,
-            rest_remaining: 0
+        let next = prev;
+
+        if (clockRunning && !prev.workout_complete) {
+          next = {
+            ...next,
+            duration: Math.floor((Date.now() - startTime) / 1000)
           };
         }
-         
-        return {
-          ...prev,
-          rest_remaining: remaining
-        };
+
+        // Rest timer - counts down and ends rest period when complete
+        if (prev.in_rest_period) {
+          const remaining = (prev.rest_remaining || 1) - 1;
+          
+          if (remaining <= 0) {
+            // Rest complete - ready for next set
+            console.log('[WorkoutContext] Rest complete - ready for next set');
+            next = {
+              ...next,
+              in_rest_period: false,
+              rest_remaining: 0
+            };
+          } else {
+            next = {
+              ...next,
+              rest_remaining: remaining
+            };
+          }
+        }
+
+        return next;
       });
-    }, 1000);
+    }, TIME.ONE_SECOND_MS);
 
-    return () => clearInterval(timer);
-  }, [stats.in_rest_period]);
+    return () => clearInterval(interval);
+  }, [clockRunning, inRestPeriod, startTime]);
 
   const loadExercises = async (): Promise<void> => {
     try {
@@ -222,6 +230,7 @@ export const WorkoutProvider: React.FC<WorkoutProviderProps> = ({ children }) =>
         }
       }
       
+      cancelPendingMetrics();
       setIsTracking(false);
       setCurrentExercise(null);
       setCurrentExerciseIndex(null);
@@ -241,16 +250,65 @@ export const WorkoutProvider: React.FC<WorkoutProviderProps> = ({ children }) =>
     }
   };
 
+  const cancelPendingMetrics = (): void => {
+    if (metricsFlushTimerRef.current !== null) {
+      clearTimeout(metricsFlushTimerRef.current);
+      metricsFlushTimerRef.current = null;
+    }
+    pendingMetricsRef.current = null;
+  };
+
+  // Trailing refresh: apply the last metrics the throttle skipped, so the
+  // display settles on the final pose once frames stop arriving
+  const flushPendingMetrics = (): void => {
+    metricsFlushTimerRef.current = null;
+    const metrics = pendingMetricsRef.current;
+    if (!metrics) return;
+
+    pendingMetricsRef.current = null;
+    lastMetricsRefreshRef.current = performance.now();
+    setStats(prev => (prev.joint_angles === metrics ? prev : { ...prev, joint_angles: metrics }));
+  };
+
   const updateStats = (metrics: any): void => {
+    // Per-frame throttle uses the monotonic clock; wall-clock time is only needed for the session clock
+    const now = performance.now();
+    const elapsed = now - lastMetricsRefreshRef.current;
+    const metricsDue = elapsed >= TIME.LIVE_METRICS_REFRESH_MS;
+    if (metricsDue) {
+      lastMetricsRefreshRef.current = now;
+      cancelPendingMetrics();
+    } else {
+      pendingMetricsRef.current = metrics;
+      if (metricsFlushTimerRef.current === null) {
+        metricsFlushTimerRef.current = setTimeout(flushPendingMetrics, TIME.LIVE_METRICS_REFRESH_MS - elapsed);
+      }
+    }
+
     // Update live joint angles/metrics and current instruction
-    setStats(prev => ({
-      ...prev,
-      joint_angles: metrics,
+    setStats(prev => {
       // Hide instruction during rest, otherwise show current instruction
-      current_instruction: prev.in_rest_period ? undefined : metrics.current_instruction,
+      const currentInstruction = prev.in_rest_period ? undefined : metrics.current_instruction;
       // Clear quality feedback when back at starting position
-      rep_quality: metrics.clear_quality ? undefined : prev.rep_quality
-    }));
+      const repQuality = metrics.clear_quality ? undefined : prev.rep_quality;
+
+      // Keep the previous stats object (and skip re-rendering consumers) unless
+      // something visible changed or the live metrics are due for a refresh
+      if (
+        !metricsDue &&
+        currentInstruction === prev.current_instruction &&
+        repQuality === prev.rep_quality
+      ) {
+        return prev;
+      }
+
+      return {
+        ...prev,
+        joint_angles: metrics,
+        current_instruction: currentInstruction,
+        rep_quality: repQuality
+      };
+    });
   };
 
   const handleRepComplete = (repData: any): void => {
@@ -4,6 +4,7 @@ import { useWorkout } from '../WorkoutContext';
 import type { ReactNode } from 'react';
 import type { UploadResults } from '../../types';
 import { MockProviders } from '../../test/MockProviders';
+import { TIME } from '../../constants';
 
 // Mock the API module
 vi.mock('../../services/api', () => ({
@@ -534,6 +535,20 @@ describe('WorkoutContext', () => {
   });
 
   describe('Stats Update', () => {
+    let now: number;
+
+    beforeEach(() => {
+      // Drive the live-metrics throttle from a controlled clock
+      now = 1000;
+      vi.spyOn(performance, 'now').mockImplementation(() => now);
+      vi.useFakeTimers({ toFake: ['setTimeout', 'clearTimeout'] });
+    });
+
+    afterEach(() => {
+      vi.useRealTimers();
+      vi.mocked(performance.now).mockRestore();
+    });
+
     it('should update joint angles', () => {
       const { result } = renderHook(() => useWorkout(), { wrapper });
 
@@ -549,5 +564,70 @@ describe('WorkoutContext', () => {
 
       expect(result.current.stats.joint_angles).toEqual(metrics);
     });
+
+    it('should keep stats unchanged for back-to-back frames with the same instruction', () => {
+      const { result } = renderHook(() => useWorkout(), { wrapper });
+
+      act(() => {
+        result.current.updateStats({ left_knee: 90, current_instruction: 'Go down' });
+      });
+      const statsAfterFirstFrame = result.current.stats;
+
+      act(() => {
+        result.current.updateStats({ left_knee: 91, current_instruction: 'Go down' });
+      });
+
+      expect(result.current.stats).toBe(statsAfterFirstFrame);
+    });
+
+    it('should refresh joint angles once the refresh interval has elapsed', () => {
+      const { result } = renderHook(() => useWorkout(), { wrapper });
+
+      act(() => {
+        result.current.updateStats({ left_knee: 90, current_instruction: 'Go down' });
+      });
+
+      now += TIME.LIVE_METRICS_REFRESH_MS;
+      act(() => {
+        result.current.updateStats({ left_knee: 75, current_instruction: 'Go down' });
+      });
+
+      expect(result.current.stats.joint_angles).toEqual({ left_knee: 75, current_instruction: 'Go down' });
+    });
+
+    it('should apply the last throttled frame after the refresh interval', () => {
+      const { result } = renderHook(() => useWorkout(), { wrapper });
+
+      act(() => {
+        result.current.updateStats({ left_knee: 90, current_instruction: 'Go down' });
+      });
+
+      now += TIME.LIVE_METRICS_REFRESH_MS / 2;
+      act(() => {
+        result.current.updateStats({ left_knee: 80, current_instruction: 'Go down' });
+      });
+      expect(result.current.stats.joint_angles).toEqual({ left_knee: 90, current_instruction: 'Go down' });
+
+      now += TIME.LIVE_METRICS_REFRESH_MS / 2;
+      act(() => {
+        vi.advanceTimersByTime(TIME.LIVE_METRICS_REFRESH_MS / 2);
+      });
+
+      expect(result.current.stats.joint_angles).toEqual({ left_knee: 80, current_instruction: 'Go down' });
+    });
+
+    it('should update immediately when the instruction changes', () => {
+      const { result } = renderHook(() => useWorkout(), { wrapper });
+
+      act(() => {
+        result.current.updateStats({ left_knee: 90, current_instruction: 'Go down' });
+      });
+      act(() => {
+        result.current.updateStats({ left_knee: 60, current_instruction: 'Push up' });
+      });
+
+      expect(result.current.stats.current_instruction).toBe('Push up');
+      expect(result.current.stats.joint_angles).toEqual({ left_knee: 60, current_instruction: 'Push up' });
+    });
   });
 });
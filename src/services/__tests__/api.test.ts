@@ -0,0 +1,74 @@
+import { describe, it, expect, beforeEach, vi } from 'vitest';
+import * as sessionStorage from '../sessionStorage';
+import { api } from '../api';
+
+vi.mock('../sessionStorage', () => ({
+  logRep: vi.fn(),
+  completeSession: vi.fn(),
+}));
+
+function deferred<T>() {
+  let resolve!: (value: T) => void;
+  let reject!: (error: unknown) => void;
+  const promise = new Promise<T>((res, rej) => {
+    resolve = res;
+    reject = rej;
+  });
+  return { promise, resolve, reject };
+}
+
+describe('api', () => {
+  describe('completeSessionV2', () => {
+    const session = { reps: [{ quality: 'Good' }] };
+    let events: string[];
+
+    beforeEach(() => {
+      events = [];
+      vi.mocked(sessionStorage.completeSession).mockReset().mockImplementation(async () => {
+        events.push('complete');
+        return { session, summary: {} } as any;
+      });
+    });
+
+    it('should wait for reps still being logged before completing the session', async () => {
+      const write = deferred<any>();
+      vi.mocked(sessionStorage.logRep).mockReturnValueOnce(write.promise);
+
+      const logged = api.logRepV2('session-1', { knee_angle: 90 }, 'Good');
+      const completed = api.completeSessionV2('session-1');
+
+      await Promise.resolve();
+      expect(sessionStorage.completeSession).not.toHaveBeenCalled();
+
+      events.push('rep saved');
+      write.resolve(session);
+      await Promise.all([logged, completed]);
+
+      expect(events).toEqual(['rep saved', 'complete']);
+    });
+
+    it('should still complete the session when a rep fails to save', async () => {
+      const write = deferred<any>();
+      vi.mocked(sessionStorage.logRep).mockReturnValueOnce(write.promise);
+
+      const logged = api.logRepV2('session-1', { knee_angle: 90 }, 'Good');
+      const completed = api.completeSessionV2('session-1');
+
+      write.reject(new Error('write failed'));
+
+      await expect(logged).rejects.toThrow('write failed');
+      await expect(completed).resolves.toMatchObject({ success: true });
+    });
+
+    it('should not wait on reps logged for another session', async () => {
+      const write = deferred<any>();
+      vi.mocked(sessionStorage.logRep).mockReturnValueOnce(write.promise);
+
+      api.logRepV2('session-2', { knee_angle: 90 }, 'Good');
+      await api.completeSessionV2('session-1');
+
+      expect(events).toEqual(['complete']);
+      write.resolve(session);
+    });
+  });
+});
@@ -1,7 +1,41 @@
-import { describe, it, expect, beforeEach } from 'vitest';
-import { getExercises, getExercise, evaluateConditions, assessRepQuality, isAtRepPosition, isAtStartingPosition, ExerciseCondition, ExerciseDefinition } from '../exerciseConfig';
+import { describe, it, expect, beforeEach, beforeAll, afterAll, vi } from 'vitest';
+import { getExercises, getExercise, getExercisesByCategory, evaluateConditions, assessRepQuality, isAtRepPosition, isAtStartingPosition, ExerciseCondition, ExerciseDefinition } from '../exerciseConfig';
+import exercisesData from '../../../public/exercises.json';
 
 describe('exerciseConfig', () => {
+  describe('cached exercise lists', () => {
+    beforeAll(() => {
+      vi.stubGlobal('fetch', vi.fn(() => Promise.resolve({
+        ok: true,
+        json: () => Promise.resolve(exercisesData)
+      })));
+    });
+
+    afterAll(() => {
+      vi.unstubAllGlobals();
+    });
+
+    it('should not let one caller change the list another caller gets', async () => {
+      const exercises = await getExercises();
+      const count = exercises.length;
+
+      expect(Object.isFrozen(exercises)).toBe(true);
+      expect(() => (exercises as ExerciseDefinition[]).push(exercises[0])).toThrow(TypeError);
+      expect(() => (exercises as ExerciseDefinition[]).sort()).toThrow(TypeError);
+      expect((await getExercises()).length).toBe(count);
+    });
+
+    it('should freeze the category map and each category list', async () => {
+      const byCategory = await getExercisesByCategory();
+      const [category] = Object.keys(byCategory);
+
+      expect(Object.isFrozen(byCategory)).toBe(true);
+      expect(Object.isFrozen(byCategory[category])).toBe(true);
+      expect(() => (byCategory[category] as ExerciseDefinition[]).pop()).toThrow(TypeError);
+      expect((await getExercisesByCategory())[category].length).toBe(byCategory[category].length);
+    });
+  });
+
   describe('evaluateConditions', () => {
     it('should evaluate less than operator', () => {
       const metrics = { knee_angle: 85 };
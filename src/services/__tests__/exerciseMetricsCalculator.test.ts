@@ -0,0 +1,344 @@
+import { describe, it, expect, vi } from 'vitest';
+import { ExerciseMetricsCalculator, ExerciseConfig, ExerciseCondition } from '../exerciseMetricsCalculator';
+import { evaluateConditions } from '../exerciseConfig';
+import type { PoseLandmark } from '../../utils/exerciseMetrics';
+import exercisesData from '../../../public/exercises.json';
+
+// The global setup mocks POSE_LANDMARKS as an empty object; the calculator needs real indices
+const { LANDMARK_INDEX } = vi.hoisted(() => ({
+  LANDMARK_INDEX: {
+    NOSE: 0,
+    LEFT_SHOULDER: 11,
+    RIGHT_SHOULDER: 12,
+    LEFT_ELBOW: 13,
+    RIGHT_ELBOW: 14,
+    LEFT_WRIST: 15,
+    RIGHT_WRIST: 16,
+    LEFT_HIP: 23,
+    RIGHT_HIP: 24,
+    LEFT_KNEE: 25,
+    RIGHT_KNEE: 26,
+    LEFT_ANKLE: 27,
+    RIGHT_ANKLE: 28,
+    LEFT_HEEL: 29,
+    RIGHT_HEEL: 30,
+    LEFT_FOOT_INDEX: 31,
+    RIGHT_FOOT_INDEX: 32,
+  } as Record<string, number>,
+}));
+
+vi.mock('@mediapipe/pose', () => ({
+  POSE_LANDMARKS: LANDMARK_INDEX,
+}));
+
+type Side = 'left' | 'right';
+type PointMap = Record<string, [number, number, number?]>;
+
+const exercises = exercisesData.exercises as unknown as Record<string, Omit<ExerciseConfig, 'id'>>;
+
+function exerciseConfig(id: string): ExerciseConfig {
+  return { id, ...exercises[id] };
+}
+
+function makeConfig(
+  metrics: ExerciseConfig['metrics'],
+  startConditions: ExerciseCondition[] = [],
+  repConditions: ExerciseCondition[] = []
+): ExerciseConfig {
+  return {
+    id: 'test',
+    name: 'Test',
+    category: 'Test',
+    joints: { required: [], bilateral: true },
+    metrics,
+    positions: {
+      starting_position: { conditions: startConditions },
+      rep_position: { conditions: repConditions },
+    },
+  };
+}
+
+/**
+ * Build a full landmark list with the given joints placed, e.g. { LEFT_HIP: [0.4, 0.5] }
+ */
+function makeLandmarks(points: PointMap, count = 33): PoseLandmark[] {
+  const landmarks: PoseLandmark[] = Array.from({ length: count }, () => ({ x: 0, y: 0, z: 0, visibility: 1 }));
+  for (const [name, [x, y, z = 0]] of Object.entries(points)) {
+    landmarks[LANDMARK_INDEX[name]] = { x, y, z, visibility: 1 };
+  }
+  return landmarks;
+}
+
+/**
+ * Place three joints on one side so the angle at the middle joint is 90 degrees
+ */
+function rightAngle(side: Side, [first, vertex, last]: string[]): PointMap {
+  const prefix = side.toUpperCase();
+  return {
+    [`${prefix}_${first.toUpperCase()}`]: [0.5, 0.3],
+    [`${prefix}_${vertex.toUpperCase()}`]: [0.5, 0.5],
+    [`${prefix}_${last.toUpperCase()}`]: [0.7, 0.5],
+  };
+}
+
+/**
+ * Place three joints on one side in a straight line (180 degrees)
+ */
+function straightLine(side: Side, [first, vertex, last]: string[]): PointMap {
+  const prefix = side.toUpperCase();
+  return {
+    [`${prefix}_${first.toUpperCase()}`]: [0.4, 0.2],
+    [`${prefix}_${vertex.toUpperCase()}`]: [0.4, 0.5],
+    [`${prefix}_${last.toUpperCase()}`]: [0.4, 0.8],
+  };
+}
+
+describe('ExerciseMetricsCalculator', () => {
+  describe('bilateral_angle', () => {
+    const config = makeConfig({
+      knee_angle: { calculation: 'bilateral_angle', points: ['hip', 'knee', 'ankle'] },
+    });
+
+    it('should average the left and right angles', () => {
+      const calc = new ExerciseMetricsCalculator(config);
+      const landmarks = makeLandmarks({
+        ...straightLine('left', ['hip', 'knee', 'ankle']),
+        ...rightAngle('right', ['hip', 'knee', 'ankle']),
+      });
+
+      expect(calc.calculateMetrics(landmarks).knee_angle).toBeCloseTo(135, 5);
+    });
+
+    it('should return 0 when the angle is undefined', () => {
+      const calc = new ExerciseMetricsCalculator(config);
+
+      // Every joint at the origin gives zero-length vectors
+      expect(calc.calculateMetrics(makeLandmarks({})).knee_angle).toBe(0);
+    });
+  });
+
+  describe('unilateral_angle', () => {
+    it('should measure the configured side only', () => {
+      const points = ['shoulder', 'elbow', 'wrist'];
+      const calc = new ExerciseMetricsCalculator(makeConfig({
+        elbow_angle: { calculation: 'unilateral_angle', side: 'right', points },
+      }));
+      const landmarks = makeLandmarks({
+        ...straightLine('left', points),
+        ...rightAngle('right', points),
+      });
+
+      expect(calc.calculateMetrics(landmarks).elbow_angle).toBeCloseTo(90, 5);
+    });
+
+    it('should default to the left side', () => {
+      const points = ['hip', 'knee', 'ankle'];
+      const calc = new ExerciseMetricsCalculator(makeConfig({
+        knee_angle: { calculation: 'unilateral_angle', points },
+      }));
+      const landmarks = makeLandmarks({
+        ...rightAngle('left', points),
+        ...straightLine('right', points),
+      });
+
+      expect(calc.calculateMetrics(landmarks).knee_angle).toBeCloseTo(90, 5);
+    });
+  });
+
+  describe('vertical_distance_average', () => {
+    // Left heel below its ankle, right heel above: the signed distances cancel out
+    const landmarks = makeLandmarks({
+      LEFT_HEEL: [0.4, 0.8],
+      LEFT_ANKLE: [0.4, 0.7],
+      RIGHT_HEEL: [0.6, 0.7],
+      RIGHT_ANKLE: [0.6, 0.8],
+    });
+
+    it('should take absolute distances per side before averaging', () => {
+      const calc = new ExerciseMetricsCalculator(makeConfig({
+        heel_height: { calculation: 'vertical_distance_average', points: ['heel', 'ankle'], absolute: true },
+      }));
+
+      expect(calc.calculateMetrics(landmarks).heel_height).toBeCloseTo(0.1, 10);
+    });
+
+    it('should average signed distances when not absolute', () => {
+      const calc = new ExerciseMetricsCalculator(makeConfig({
+        heel_height: { calculation: 'vertical_distance_average', points: ['heel', 'ankle'] },
+      }));
+
+      expect(calc.calculateMetrics(landmarks).heel_height).toBeCloseTo(0, 10);
+    });
+  });
+
+  describe('incomplete landmarks', () => {
+    it('should report 0 for every metric when landmarks are missing', () => {
+      const points = ['hip', 'knee', 'ankle'];
+      const calc = new ExerciseMetricsCalculator(makeConfig(
+        {
+          knee_angle: { calculation: 'bilateral_angle', points },
+          hip_height: { calculation: 'single_joint_y', point: 'hip' },
+        },
+        [{ metric: 'knee_angle', operator: '<', value: 1 }]
+      ));
+      const landmarks = makeLandmarks(rightAngle('left', points)).slice(0, LANDMARK_INDEX.LEFT_ANKLE);
+
+      const { metrics, isAtStart } = calc.evaluateFrame(landmarks);
+      expect(metrics).toEqual({ knee_angle: 0, hip_height: 0 });
+      expect(isAtStart).toBe(true);
+    });
+
+    it('should report 0 for an empty landmark list', () => {
+      const calc = new ExerciseMetricsCalculator(makeConfig({
+        knee_angle: { calculation: 'bilateral_angle', points: ['hip', 'knee', 'ankle'] },
+      }));
+
+      expect(calc.calculateMetrics([])).toEqual({ knee_angle: 0 });
+    });
+  });
+
+  describe('compiled conditions', () => {
+    const operators: ExerciseCondition['operator'][] = ['>', '<', '>=', '<=', '==', 'abs_>', 'abs_<'];
+    const values = [-20, -10, 0, 10, 20];
+
+    it.each(operators)('should match evaluateConditions for %s', (operator) => {
+      const conditions: ExerciseCondition[] = [{ metric: 'angle', operator, value: 10 }];
+      const calc = new ExerciseMetricsCalculator(makeConfig({}, conditions, conditions));
+
+      for (const value of values) {
+        const metrics = { angle: value };
+        expect(calc.isAtStartingPosition(metrics)).toBe(evaluateConditions(metrics, conditions));
+        expect(calc.isAtRepPosition(metrics)).toBe(evaluateConditions(metrics, conditions));
+        expect(calc.evaluateConditions(metrics, conditions)).toBe(evaluateConditions(metrics, conditions));
+      }
+    });
+
+    it('should fail conditions on a missing metric', () => {
+      const conditions: ExerciseCondition[] = [{ metric: 'missing', operator: 'abs_<', value: 10 }];
+      const calc = new ExerciseMetricsCalculator(makeConfig({}, conditions));
+
+      expect(calc.isAtStartingPosition({ angle: 0 })).toBe(false);
+      expect(evaluateConditions({ angle: 0 }, conditions)).toBe(false);
+    });
+
+    it('should require every condition to hold', () => {
+      const conditions: ExerciseCondition[] = [
+        { metric: 'knee_angle', operator: '>', value: 140 },
+        { metric: 'squat_depth', operator: '>', value: 0.18 },
+      ];
+      const calc = new ExerciseMetricsCalculator(makeConfig({}, conditions));
+
+      expect(calc.isAtStartingPosition({ knee_angle: 170, squat_depth: 0.2 })).toBe(true);
+      expect(calc.isAtStartingPosition({ knee_angle: 170, squat_depth: 0.1 })).toBe(false);
+    });
+  });
+
+  describe('evaluateFrame motion gate', () => {
+    const points = ['hip', 'knee', 'ankle'];
+    const config = makeConfig(
+      { knee_angle: { calculation: 'bilateral_angle', points } },
+      [{ metric: 'knee_angle', operator: '>', value: 160 }],
+      [{ metric: 'knee_angle', operator: '<', value: 100 }]
+    );
+    const pose: PointMap = { ...rightAngle('left', points), ...rightAngle('right', points) };
+
+    it('should reuse the last result while the joints are still', () => {
+      const calc = new ExerciseMetricsCalculator(config);
+      const first = calc.evaluateFrame(makeLandmarks(pose));
+      const firstMetrics = first.metrics;
+
+      const second = calc.evaluateFrame(makeLandmarks({ ...pose, LEFT_KNEE: [0.5001, 0.5] }));
+      expect(second).toBe(first);
+      expect(second.metrics).toBe(firstMetrics);
+      expect(second.isAtRep).toBe(true);
+    });
+
+    it('should re-evaluate once drift accumulates past the threshold', () => {
+      const calc = new ExerciseMetricsCalculator(config);
+      const firstMetrics = calc.evaluateFrame(makeLandmarks(pose)).metrics;
+
+      // Each step is small, but movement is measured from the last evaluated frame
+      for (const x of [0.7004, 0.7008]) {
+        expect(calc.evaluateFrame(makeLandmarks({ ...pose, LEFT_ANKLE: [x, 0.5] })).metrics).toBe(firstMetrics);
+      }
+
+      const drifted = calc.evaluateFrame(makeLandmarks({ ...pose, LEFT_ANKLE: [0.7012, 0.5] })).metrics;
+      expect(drifted).not.toBe(firstMetrics);
+    });
+
+    it('should re-evaluate on depth-only movement', () => {
+      const calc = new ExerciseMetricsCalculator(config);
+      const firstMetrics = calc.evaluateFrame(makeLandmarks(pose)).metrics;
+
+      // Moving the left hip and ankle toward the camera closes the left knee to 60 degrees
+      const { metrics } = calc.evaluateFrame(makeLandmarks({
+        ...pose,
+        LEFT_HIP: [0.5, 0.3, 0.2],
+        LEFT_ANKLE: [0.7, 0.5, 0.2],
+      }));
+      expect(metrics).not.toBe(firstMetrics);
+      expect(metrics.knee_angle).toBeCloseTo(75, 5);
+    });
+
+    it('should always evaluate incomplete frames', () => {
+      const calc = new ExerciseMetricsCalculator(config);
+      const landmarks = makeLandmarks(pose);
+      calc.evaluateFrame(landmarks);
+
+      const { metrics } = calc.evaluateFrame(landmarks.slice(0, LANDMARK_INDEX.LEFT_HIP));
+      expect(metrics).toEqual({ knee_angle: 0 });
+      expect(calc.evaluateFrame(landmarks).metrics.knee_angle).toBeCloseTo(90, 5);
+    });
+  });
+
+  describe('metrics outside the required joints', () => {
+    it.each([
+      ['concentration_curl', 'elbow_angle'],
+      ['superman', 'body_extension'],
+      ['pistol_squat', 'knee_angle'],
+      ['plank', 'body_angle'],
+      ['sit_up', 'torso_angle'],
+      ['v_up', 'body_fold'],
+    ])('should measure unilateral %s.%s', (exerciseId, metricName) => {
+      const config = exerciseConfig(exerciseId);
+      const metric = config.metrics[metricName];
+      const calc = new ExerciseMetricsCalculator(config);
+
+      const metrics = calc.calculateMetrics(makeLandmarks(rightAngle(metric.side || 'left', metric.points!)));
+      expect(metrics[metricName]).toBeCloseTo(90, 5);
+    });
+
+    it('should measure leg_raise.leg_angle and count the raised position', () => {
+      const points = exerciseConfig('leg_raise').metrics.leg_angle.points!;
+      const calc = new ExerciseMetricsCalculator(exerciseConfig('leg_raise'));
+
+      const { metrics, isAtRep } = calc.evaluateFrame(makeLandmarks({
+        ...rightAngle('left', points),
+        ...rightAngle('right', points),
+      }));
+      expect(metrics.leg_angle).toBeCloseTo(90, 5);
+      expect(isAtRep).toBe(true);
+    });
+
+    it('should measure burpee.elbow_angle', () => {
+      const points = exerciseConfig('burpee').metrics.elbow_angle.points!;
+      const calc = new ExerciseMetricsCalculator(exerciseConfig('burpee'));
+
+      const metrics = calc.calculateMetrics(makeLandmarks({
+        ...rightAngle('left', points),
+        ...straightLine('right', points),
+      }));
+      expect(metrics.elbow_angle).toBeCloseTo(135, 5);
+    });
+
+    it('should measure jumping_jack.arm_spread', () => {
+      const calc = new ExerciseMetricsCalculator(exerciseConfig('jumping_jack'));
+
+      const metrics = calc.calculateMetrics(makeLandmarks({
+        LEFT_WRIST: [0.8, 0.2],
+        RIGHT_WRIST: [0.2, 0.2],
+      }));
+      expect(metrics.arm_spread).toBeCloseTo(0.6, 10);
+    });
+  });
+});
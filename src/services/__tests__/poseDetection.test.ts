@@ -0,0 +1,220 @@
+import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
+import { ClientSidePoseDetector } from '../poseDetection';
+
+// The detector constructs the shared Pose graph with `new`, so the mock is a class
+const { poseSend } = vi.hoisted(() => ({
+  poseSend: vi.fn(() => Promise.resolve()),
+}));
+
+vi.mock('@mediapipe/pose', () => ({
+  Pose: class {
+    setOptions = vi.fn();
+    onResults = vi.fn();
+    send = poseSend;
+    reset = vi.fn();
+    initialize = vi.fn(() => Promise.resolve());
+    close = vi.fn();
+  },
+  POSE_CONNECTIONS: [],
+  POSE_LANDMARKS: {},
+}));
+
+vi.mock('@mediapipe/camera_utils', () => ({
+  Camera: vi.fn(),
+}));
+
+vi.mock('@mediapipe/drawing_utils', () => ({
+  drawConnectors: vi.fn(),
+  drawLandmarks: vi.fn(),
+}));
+
+type FrameCallback = (...args: unknown[]) => Promise<void> | void;
+
+// Frame callbacks requested by the detector, run one at a time by the tests
+const queuedFrames: FrameCallback[] = [];
+let currentTime = 0;
+let paused = false;
+
+function installFrameSource(supportsVideoFrameCallback: boolean): void {
+  vi.stubGlobal('requestAnimationFrame', vi.fn((callback: FrameCallback) => queuedFrames.push(callback)));
+
+  if (supportsVideoFrameCallback) {
+    Object.defineProperty(HTMLVideoElement.prototype, 'requestVideoFrameCallback', {
+      configurable: true,
+      writable: true,
+      value: vi.fn((callback: FrameCallback) => queuedFrames.push(callback)),
+    });
+  }
+}
+
+async function runNextFrame(): Promise<void> {
+  const callback = queuedFrames.shift();
+  await callback?.(performance.now(), {});
+}
+
+async function startWebcam(detector: ClientSidePoseDetector): Promise<HTMLVideoElement> {
+  const stream = { getTracks: () => [{ stop: vi.fn() }] };
+  Object.defineProperty(navigator, 'mediaDevices', {
+    configurable: true,
+    value: { getUserMedia: vi.fn(() => Promise.resolve(stream)) },
+  });
+
+  await detector.startFromWebcam(document.createElement('canvas'), vi.fn());
+  await vi.waitFor(() => expect(queuedFrames).toHaveLength(1));
+  return document.body.querySelector('video')!;
+}
+
+async function startVideoFile(detector: ClientSidePoseDetector): Promise<HTMLVideoElement> {
+  Object.defineProperty(URL, 'createObjectURL', { configurable: true, writable: true, value: vi.fn(() => 'blob:workout') });
+  Object.defineProperty(URL, 'revokeObjectURL', { configurable: true, writable: true, value: vi.fn() });
+
+  const file = new File(['video'], 'workout.mp4', { type: 'video/mp4' });
+  const started = detector.startFromVideoFile(file, document.createElement('canvas'), vi.fn());
+  const video = document.body.querySelector('video')!;
+  video.onloadedmetadata?.(new Event('loadedmetadata'));
+
+  await started;
+  await vi.waitFor(() => expect(queuedFrames).toHaveLength(1));
+  return video;
+}
+
+describe('ClientSidePoseDetector', () => {
+  beforeEach(() => {
+    poseSend.mockClear().mockImplementation(() => Promise.resolve());
+    queuedFrames.length = 0;
+    currentTime = 0;
+    paused = false;
+
+    // jsdom does not play media, so report a playing video at a controlled position
+    vi.spyOn(HTMLMediaElement.prototype, 'play').mockResolvedValue(undefined);
+    vi.spyOn(HTMLMediaElement.prototype, 'load').mockImplementation(() => {});
+    vi.spyOn(HTMLMediaElement.prototype, 'paused', 'get').mockImplementation(() => paused);
+    vi.spyOn(HTMLMediaElement.prototype, 'ended', 'get').mockReturnValue(false);
+    vi.spyOn(HTMLMediaElement.prototype, 'readyState', 'get').mockReturnValue(4);
+    vi.spyOn(HTMLMediaElement.prototype, 'currentTime', 'get').mockImplementation(() => currentTime);
+  });
+
+  afterEach(() => {
+    Reflect.deleteProperty(HTMLVideoElement.prototype, 'requestVideoFrameCallback');
+    vi.unstubAllGlobals();
+    vi.restoreAllMocks();
+  });
+
+  describe.each([
+    ['requestVideoFrameCallback', true],
+    ['requestAnimationFrame', false],
+  ])('webcam frame loop driven by %s', (_, supportsVideoFrameCallback) => {
+    beforeEach(() => {
+      installFrameSource(supportsVideoFrameCallback);
+    });
+
+    it('should keep the webcam video rendered rather than display:none', async () => {
+      const detector = new ClientSidePoseDetector({ modelComplexity: 1 });
+      const video = await startWebcam(detector);
+
+      expect(video.style.display).not.toBe('none');
+      expect(video.style.opacity).toBe('0');
+
+      detector.stop();
+      expect(document.body.contains(video)).toBe(false);
+    });
+
+    it('should run inference only when the video presents a new frame', async () => {
+      const detector = new ClientSidePoseDetector({ modelComplexity: 1 });
+      await startWebcam(detector);
+      expect(poseSend).toHaveBeenCalledTimes(1);
+
+      // Same playback position: no inference, but the loop keeps going
+      await runNextFrame();
+      expect(poseSend).toHaveBeenCalledTimes(1);
+      expect(queuedFrames).toHaveLength(1);
+
+      currentTime = 1 / 30;
+      await runNextFrame();
+      expect(poseSend).toHaveBeenCalledTimes(2);
+
+      if (supportsVideoFrameCallback) {
+        expect(requestAnimationFrame).not.toHaveBeenCalled();
+      } else {
+        expect(requestAnimationFrame).toHaveBeenCalled();
+      }
+
+      detector.stop();
+      currentTime = 2 / 30;
+      await runNextFrame();
+      expect(poseSend).toHaveBeenCalledTimes(2);
+      expect(queuedFrames).toHaveLength(0);
+    });
+  });
+
+  describe.each([
+    ['requestVideoFrameCallback', true],
+    ['requestAnimationFrame', false],
+  ])('video file frame loop driven by %s', (_, supportsVideoFrameCallback) => {
+    beforeEach(() => {
+      installFrameSource(supportsVideoFrameCallback);
+    });
+
+    it('should keep the file video rendered and remove it on stop', async () => {
+      const detector = new ClientSidePoseDetector({ modelComplexity: 1 });
+      const video = await startVideoFile(detector);
+
+      expect(video.style.display).not.toBe('none');
+      expect(video.style.opacity).toBe('0');
+
+      detector.stop();
+      expect(document.body.contains(video)).toBe(false);
+      expect(URL.revokeObjectURL).toHaveBeenCalledWith('blob:workout');
+    });
+
+    it('should skip repeated frames and stop while the video is paused', async () => {
+      const detector = new ClientSidePoseDetector({ modelComplexity: 1 });
+      await startVideoFile(detector);
+      expect(poseSend).toHaveBeenCalledTimes(1);
+
+      await runNextFrame();
+      expect(poseSend).toHaveBeenCalledTimes(1);
+
+      currentTime = 1 / 30;
+      await runNextFrame();
+      expect(poseSend).toHaveBeenCalledTimes(2);
+
+      paused = true;
+      currentTime = 2 / 30;
+      await runNextFrame();
+      expect(poseSend).toHaveBeenCalledTimes(2);
+      expect(queuedFrames).toHaveLength(0);
+
+      detector.stop();
+    });
+
+    it('should run inference on every other frame once the adaptive fallback skips frames', async () => {
+      // Model left to the device default, so slow inference triggers the fallback
+      const detector = new ClientSidePoseDetector();
+      await startVideoFile(detector);
+
+      // Every inference now takes 100ms, twice the budget
+      let clock = 0;
+      vi.spyOn(performance, 'now').mockImplementation(() => clock);
+      poseSend.mockImplementation(() => {
+        clock += 100;
+        return Promise.resolve();
+      });
+
+      // Enough slow frames to step down to the lite model and then to frame skipping
+      for (let frame = 1; frame <= 60; frame++) {
+        currentTime = frame / 30;
+        await runNextFrame();
+      }
+
+      const sentBefore = poseSend.mock.calls.length;
+      for (let frame = 61; frame <= 64; frame++) {
+        currentTime = frame / 30;
+        await runNextFrame();
+      }
+      expect(poseSend.mock.calls.length - sentBefore).toBe(2);
+
+      detector.stop();
+    });
+  });
+});
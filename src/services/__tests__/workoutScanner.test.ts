@@ -1,5 +1,7 @@
 import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
+import { createWorker, createScheduler } from 'tesseract.js';
 import { WorkoutScanner, WorkoutExercise } from '../workoutScanner';
+import exercisesData from '../../../public/exercises.json';
 
 describe('WorkoutScanner', () => {
   let scanner: WorkoutScanner;
@@ -12,6 +14,61 @@ describe('WorkoutScanner', () => {
     await scanner.terminate();
   });
 
+  describe('OCR workers', () => {
+    const image = new File(['image'], 'workout.png', { type: 'image/png' });
+    const video = new File(['video'], 'workout.mp4', { type: 'video/mp4' });
+
+    beforeEach(() => {
+      vi.mocked(createWorker).mockClear();
+      vi.mocked(createScheduler).mockClear();
+      vi.stubGlobal('fetch', vi.fn(() => Promise.resolve({
+        ok: true,
+        json: () => Promise.resolve(exercisesData)
+      })));
+      Object.defineProperty(URL, 'createObjectURL', { configurable: true, writable: true, value: vi.fn(() => 'blob:workout') });
+      Object.defineProperty(URL, 'revokeObjectURL', { configurable: true, writable: true, value: vi.fn() });
+
+      // jsdom does not decode video: report an empty clip once the source is set
+      vi.spyOn(HTMLMediaElement.prototype, 'duration', 'get').mockReturnValue(0);
+      vi.spyOn(HTMLMediaElement.prototype, 'load').mockImplementation(() => {});
+      vi.spyOn(HTMLMediaElement.prototype, 'src', 'set').mockImplementation(function (this: HTMLMediaElement) {
+        queueMicrotask(() => this.onloadedmetadata?.(new Event('loadedmetadata')));
+      });
+    });
+
+    afterEach(() => {
+      vi.unstubAllGlobals();
+      vi.restoreAllMocks();
+    });
+
+    // Workers added to the one scheduler the scanner created
+    const addedWorkers = () => vi.mocked(vi.mocked(createScheduler).mock.results[0].value.addWorker).mock.calls.length;
+
+    it('should start a single worker to scan an image', async () => {
+      await scanner.processImage(image);
+
+      expect(createScheduler).toHaveBeenCalledTimes(1);
+      expect(createWorker).toHaveBeenCalledTimes(1);
+      expect(addedWorkers()).toBe(1);
+    });
+
+    it('should grow the same scheduler to the full pool when a video is scanned', async () => {
+      await scanner.processImage(image);
+      await scanner.processVideo(video);
+      const poolSize = vi.mocked(createWorker).mock.calls.length;
+
+      expect(createScheduler).toHaveBeenCalledTimes(1);
+      expect(poolSize).toBeGreaterThanOrEqual(1);
+      expect(addedWorkers()).toBe(poolSize);
+
+      // Later scans reuse the pool
+      await scanner.processVideo(video);
+      await scanner.processImage(image);
+      expect(createWorker).toHaveBeenCalledTimes(poolSize);
+      expect(addedWorkers()).toBe(poolSize);
+    });
+  });
+
   describe('parseGenericWorkoutFormat', () => {
     it('should parse basic exercise with sets and reps', () => {
       const text = `
@@ -60,6 +117,19 @@ Bicep Curls
       expect(result[2].reps).toBe(12);
     });
 
+    it('should read reps-first lines as sets and reps', () => {
+      const text = `
+Barbell Squats
+10 reps, 4 sets
+      `;
+
+      const result = scanner.parseGenericWorkoutFormat(text);
+
+      expect(result).toHaveLength(1);
+      expect(result[0].sets).toBe(4);
+      expect(result[0].reps).toBe(10);
+    });
+
     it('should skip non-exercise lines', () => {
       const text = `
 Leg Day
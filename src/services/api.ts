@@ -1,4 +1,3 @@
-import axios from 'axios';
 import type {
   WorkoutOptions,
 } from '../types';
@@ -8,6 +7,11 @@ import { getWorkoutScanner, ScanProgress } from './workoutScanner';
 
 const API_BASE_URL = '/api';
 
+// Rep writes still in flight, per session. The video feed logs reps without
+// waiting on them, so completing a session first lets them land; otherwise the
+// summary could be built before the last rep is saved
+const pendingRepLogs = new Map<string, Set<Promise<unknown>>>();
+
 export const api = {
   // ========== Workout Scanner (Client-Side with Tesseract.js) ==========
   
@@ -90,12 +94,27 @@ export const api = {
 
   // Log a rep (client-side)
   logRepV2: async (sessionId: string, metrics: any, quality: string): Promise<any> => {
-    const session = await sessionStorage.logRep(sessionId, metrics, quality);
-    return {
-      success: true,
-      session,
-      rep: session.reps[session.reps.length - 1]
-    };
+    const write = sessionStorage.logRep(sessionId, metrics, quality);
+    let pending = pendingRepLogs.get(sessionId);
+    if (!pending) {
+      pending = new Set();
+      pendingRepLogs.set(sessionId, pending);
+    }
+    pending.add(write);
+
+    try {
+      const session = await write;
+      return {
+        success: true,
+        session,
+        rep: session.reps[session.reps.length - 1]
+      };
+    } finally {
+      pending.delete(write);
+      if (pending.size === 0 && pendingRepLogs.get(sessionId) === pending) {
+        pendingRepLogs.delete(sessionId);
+      }
+    }
   },
 
   // Validate rep metrics (client-side)
@@ -121,6 +140,12 @@ export const api = {
 
   // Complete session (client-side)
   completeSessionV2: async (sessionId: string): Promise<any> => {
+    // A rep that failed to save was already reported by its caller
+    const pending = pendingRepLogs.get(sessionId);
+    if (pending) {
+      await Promise.allSettled(pending);
+    }
+
     const result = await sessionStorage.completeSession(sessionId);
     return {
       success: true,
@@ -56,6 +56,11 @@ export interface ExerciseDefinition extends ExerciseConfig {
 }
 
 let exercisesCache: { [key: string]: ExerciseConfig } | null = null;
+// Derived views of the static exercise list, built once and shared by all callers.
+// They are frozen, so one caller sorting or pushing cannot change another's list
+let exerciseListCache: readonly ExerciseDefinition[] | null = null;
+let exercisesByIdCache: Map<string, ExerciseDefinition> | null = null;
+let exercisesByCategoryCache: Readonly<{ [category: string]: readonly ExerciseDefinition[] }> | null = null;
 
 /**
  * Load exercises from static JSON file
@@ -85,35 +90,43 @@ async function loadExercises(): Promise<{ [key: string]: ExerciseConfig }> {
 /**
  * Get all available exercises
  */
-export async function getExercises(): Promise<ExerciseDefinition[]> {
+export async function getExercises(): Promise<readonly ExerciseDefinition[]> {
+  if (exerciseListCache !== null) {
+    return exerciseListCache;
+  }
+
   const exercises = await loadExercises();
-  return Object.entries(exercises).map(([id, config]) => ({
+  // Definitions are shared between callers, so they are frozen against accidental edits
+  exerciseListCache = Object.freeze(Object.entries(exercises).map(([id, config]) => Object.freeze({
     id,
     ...config
-  }));
+  })));
+  exercisesByIdCache = new Map(exerciseListCache.map(exercise => [exercise.id, exercise]));
+  return exerciseListCache;
 }
 
 /**
  * Get a specific exercise by ID
  */
 export async function getExercise(exerciseId: string): Promise<ExerciseDefinition> {
-  const exercises = await loadExercises();
-  const config = exercises[exerciseId];
+  await getExercises();
+  const exercise = exercisesByIdCache!.get(exerciseId);
   
-  if (!config) {
+  if (!exercise) {
     throw new Error(`Exercise not found: ${exerciseId}`);
   }
   
-  return {
-    id: exerciseId,
-    ...config
-  };
+  return exercise;
 }
 
 /**
  * Get exercises grouped by category
  */
-export async function getExercisesByCategory(): Promise<{ [category: string]: ExerciseDefinition[] }> {
+export async function getExercisesByCategory(): Promise<Readonly<{ [category: string]: readonly ExerciseDefinition[] }>> {
+  if (exercisesByCategoryCache !== null) {
+    return exercisesByCategoryCache;
+  }
+
   const allExercises = await getExercises();
   const byCategory: { [category: string]: ExerciseDefinition[] } = {};
   
@@ -124,7 +137,11 @@ export async function getExercisesByCategory(): Promise<{ [category: string]: Ex
     byCategory[exercise.category].push(exercise);
   }
   
-  return byCategory;
+  for (const category of Object.keys(byCategory)) {
+    Object.freeze(byCategory[category]);
+  }
+  exercisesByCategoryCache = Object.freeze(byCategory);
+  return exercisesByCategoryCache;
 }
 
 /**
@@ -167,21 +184,17 @@ export function evaluateConditions(metrics: any, conditions: ExerciseCondition[]
   return true;
 }
 
+// Quality tiers checked in order; the first whose conditions all hold wins
+const QUALITY_LEVEL_ORDER = ['excellent', 'good'] as const;
+
 /**
  * Assess rep quality based on metrics
  */
 export function assessRepQuality(config: ExerciseConfig, metrics: any): string {
-  // Check excellent first
-  if (config.quality_levels.excellent && config.quality_levels.excellent.conditions) {
-    if (evaluateConditions(metrics, config.quality_levels.excellent.conditions)) {
-      return config.quality_levels.excellent.message;
-    }
-  }
-
-  // Then good
-  if (config.quality_levels.good && config.quality_levels.good.conditions) {
-    if (evaluateConditions(metrics, config.quality_levels.good.conditions)) {
-      return config.quality_levels.good.message;
+  for (const level of QUALITY_LEVEL_ORDER) {
+    const conditions = config.quality_levels[level]?.conditions;
+    if (conditions && evaluateConditions(metrics, conditions)) {
+      return config.quality_levels[level]!.message;
     }
   }
 
@@ -5,7 +5,6 @@
 
 import {
   calculateAngle,
-  calculateBilateralAngle,
   calculateDistance2D,
   calculateVerticalDistance,
   calculateHorizontalDistance,
@@ -18,6 +17,12 @@ export interface ExerciseMetrics {
   [metricName: string]: number;
 }
 
+export interface FrameEvaluation {
+  metrics: ExerciseMetrics;
+  isAtStart: boolean;
+  isAtRep: boolean;
+}
+
 export interface ExerciseCondition {
   metric: string;
   operator: '>' | '<' | '>=' | '<=' | '==' | 'abs_>' | 'abs_<';
@@ -61,269 +66,348 @@ export interface ExerciseConfig {
   };
 }
 
+type MetricConfig = ExerciseConfig['metrics'][string];
+
+interface LandmarkSelection {
+  indices: number[];
+  // Scratch array refilled every frame so no point arrays are allocated per frame
+  points: Point3D[];
+}
+
+// Measurement taken on one side's points; bilateral metrics average it over both sides
+type SideMeasure = (points: Point3D[]) => number;
+
+const measureAngle: SideMeasure = (points) => calculateAngle(points[0], points[1], points[2]);
+const measureVerticalDistance: SideMeasure = (points) => calculateVerticalDistance(points[0], points[1]);
+const measureAbsVerticalDistance: SideMeasure = (points) => Math.abs(calculateVerticalDistance(points[0], points[1]));
+const measureDistance2D: SideMeasure = (points) => calculateDistance2D(points[0], points[1]);
+
+interface MetricEvaluator {
+  name: string;
+  evaluate: () => number;
+}
+
+type ConditionPredicate = (metrics: ExerciseMetrics) => boolean;
+
+// A frame whose tracked landmarks moved less than this in total since the last
+// evaluated frame (summed |dx| + |dy| + |dz| in MediaPipe's normalized
+// coordinates, i.e. well under a pixel per joint) reuses the last result.
+// z is included because angle metrics are computed in 3D.
+const MOTION_EPSILON = 1e-3;
+
 /**
  * Exercise Metrics Calculator
  */
 export class ExerciseMetricsCalculator {
   private config: ExerciseConfig;
-  private joints: { [key: string]: Point3D } = {};
+  private landmarks: PoseLandmark[] = [];
+  private requiredLandmarkCount = 0;
+  private metricEvaluators: MetricEvaluator[];
+  private startingPositionCheck: ConditionPredicate;
+  private repPositionCheck: ConditionPredicate;
+  // Reused for every frame; metrics objects are still fresh since callers keep them
+  private frameEvaluation: FrameEvaluation = { metrics: {}, isAtStart: false, isAtRep: false };
+  // Every landmark index read by the metrics, and their x/y/z at the last evaluated frame
+  private trackedIndices: number[] = [];
+  private lastTrackedPositions: Float64Array | null = null;
 
   constructor(config: ExerciseConfig) {
     this.config = config;
+    this.metricEvaluators = Object.entries(config.metrics).map(([name, metricConfig]) => ({
+      name,
+      evaluate: this.resolveMetricEvaluator(metricConfig),
+    }));
+    this.startingPositionCheck = this.compileConditions(config.positions.starting_position.conditions);
+    this.repPositionCheck = this.compileConditions(config.positions.rep_position.conditions);
   }
 
   /**
-   * Get required joints from landmarks
+   * Resolve the calculation for a metric once, so per-frame work is a direct call.
+   * Joint names are turned into landmark indices here rather than on every frame.
    */
-  private extractJoints(landmarks: PoseLandmark[]): void {
-    this.joints = {};
-    const requiredJoints = this.config.joints.required;
-    const isBilateral = this.config.joints.bilateral;
-
-    for (const jointName of requiredJoints) {
-      if (isBilateral) {
-        // Get both left and right
-        const leftIndex = POSE_LANDMARKS[`LEFT_${jointName.toUpperCase()}` as keyof typeof POSE_LANDMARKS];
-        const rightIndex = POSE_LANDMARKS[`RIGHT_${jointName.toUpperCase()}` as keyof typeof POSE_LANDMARKS];
-
-        if (leftIndex !== undefined && landmarks[leftIndex]) {
-          this.joints[`left_${jointName.toLowerCase()}`] = landmarks[leftIndex];
-        }
-        if (rightIndex !== undefined && landmarks[rightIndex]) {
-          this.joints[`right_${jointName.toLowerCase()}`] = landmarks[rightIndex];
-        }
-      } else {
-        // Unilateral - joint name already has LEFT_ or RIGHT_
-        const index = POSE_LANDMARKS[jointName.toUpperCase() as keyof typeof POSE_LANDMARKS];
-        if (index !== undefined && landmarks[index]) {
-          this.joints[jointName.toLowerCase()] = landmarks[index];
-        }
+  private resolveMetricEvaluator(metricConfig: MetricConfig): () => number {
+    const points = metricConfig.points;
+    const side = metricConfig.side || 'left';
+
+    switch (metricConfig.calculation) {
+      case 'bilateral_angle': {
+        if (!points || points.length !== 3) return () => 0;
+        const left = this.resolveLandmarkSelection('left', points);
+        const right = this.resolveLandmarkSelection('right', points);
+        return () => this.averageSides(left, right, measureAngle) || 0;
       }
-    }
-  }
-
-  /**
-   * Calculate all metrics for current pose
-   */
-  calculateMetrics(landmarks: PoseLandmark[]): ExerciseMetrics {
-    this.extractJoints(landmarks);
-    const metrics: ExerciseMetrics = {};
 
-    for (const [metricName, metricConfig] of Object.entries(this.config.metrics)) {
-      const calculation = metricConfig.calculation;
+      case 'unilateral_angle': {
+        if (!points || points.length !== 3) return () => 0;
+        const selection = this.resolveLandmarkSelection(side, points);
+        return () => this.calculateUnilateralAngleMetric(selection);
+      }
 
-      switch (calculation) {
-        case 'bilateral_angle':
-          metrics[metricName] = this.calculateBilateralAngleMetric(metricConfig);
-          break;
+      case 'vertical_distance_average': {
+        if (!points || points.length !== 2) return () => 0;
+        const left = this.resolveLandmarkSelection('left', points);
+        const right = this.resolveLandmarkSelection('right', points);
+        // Absolute distances are taken per side, so opposite signs cannot cancel out
+        const measure = metricConfig.absolute ? measureAbsVerticalDistance : measureVerticalDistance;
+        return () => this.averageSides(left, right, measure);
+      }
 
-        case 'unilateral_angle':
-          metrics[metricName] = this.calculateUnilateralAngleMetric(metricConfig);
-          break;
+      case 'single_joint_y': {
+        if (!metricConfig.point) return () => 0;
+        const selection = this.resolveLandmarkSelection(side, [metricConfig.point]);
+        return () => this.calculateSingleJointY(selection);
+      }
 
-        case 'vertical_distance_average':
-          metrics[metricName] = this.calculateVerticalDistanceAverage(metricConfig);
-          break;
+      case 'distance_2d_average': {
+        if (!points || points.length !== 2) return () => 0;
+        const left = this.resolveLandmarkSelection('left', points);
+        const right = this.resolveLandmarkSelection('right', points);
+        return () => this.averageSides(left, right, measureDistance2D);
+      }
 
-        case 'single_joint_y':
-          metrics[metricName] = this.calculateSingleJointY(metricConfig);
-          break;
+      case 'horizontal_distance_average': {
+        const wrists = this.createLandmarkSelection([
+          POSE_LANDMARKS.LEFT_WRIST,
+          POSE_LANDMARKS.RIGHT_WRIST,
+        ]);
+        return () => this.calculateHorizontalDistanceAverage(wrists);
+      }
 
-        case 'distance_2d_average':
-          metrics[metricName] = this.calculateDistance2DAverage(metricConfig);
-          break;
+      default:
+        console.warn(`Unknown calculation type: ${metricConfig.calculation}`);
+        return () => 0;
+    }
+  }
 
-        case 'horizontal_distance_average':
-          metrics[metricName] = this.calculateHorizontalDistanceAverage(metricConfig);
-          break;
+  /**
+   * Resolve joint names (e.g. 'knee') on one side to MediaPipe landmark indices.
+   * Returns null if any joint name is not a known landmark.
+   */
+  private resolveLandmarkSelection(side: 'left' | 'right', jointNames: string[]): LandmarkSelection | null {
+    const indices: number[] = [];
+    for (const jointName of jointNames) {
+      const index = POSE_LANDMARKS[`${side.toUpperCase()}_${jointName.toUpperCase()}` as keyof typeof POSE_LANDMARKS];
+      if (index === undefined) return null;
+      indices.push(index);
+    }
+    return this.createLandmarkSelection(indices);
+  }
 
-        default:
-          console.warn(`Unknown calculation type: ${calculation}`);
-          metrics[metricName] = 0;
+  private createLandmarkSelection(indices: number[]): LandmarkSelection {
+    for (const index of indices) {
+      this.requiredLandmarkCount = Math.max(this.requiredLandmarkCount, index + 1);
+      if (!this.trackedIndices.includes(index)) {
+        this.trackedIndices.push(index);
       }
     }
-
-    return metrics;
+    return { indices, points: new Array<Point3D>(indices.length) };
   }
 
   /**
-   * Calculate bilateral angle (average of left and right)
+   * Calculate all metrics for current pose
    */
-  private calculateBilateralAngleMetric(config: any): number {
-    const points = config.points as string[];
-    if (!points || points.length !== 3) return 0;
+  calculateMetrics(landmarks: PoseLandmark[]): ExerciseMetrics {
+    this.landmarks = landmarks;
+    const metrics: ExerciseMetrics = {};
 
-    const [p1, p2, p3] = points;
+    // MediaPipe reports every landmark once a pose is found, so a single length
+    // check stands in for checking each landmark inside the calculations
+    const complete = landmarks.length >= this.requiredLandmarkCount;
 
-    // Get left side points
-    const leftP1 = this.joints[`left_${p1.toLowerCase()}`];
-    const leftP2 = this.joints[`left_${p2.toLowerCase()}`];
-    const leftP3 = this.joints[`left_${p3.toLowerCase()}`];
+    for (const { name, evaluate } of this.metricEvaluators) {
+      metrics[name] = complete ? evaluate() : 0;
+    }
 
-    // Get right side points
-    const rightP1 = this.joints[`right_${p1.toLowerCase()}`];
-    const rightP2 = this.joints[`right_${p2.toLowerCase()}`];
-    const rightP3 = this.joints[`right_${p3.toLowerCase()}`];
+    return metrics;
+  }
 
-    const leftPoints = leftP1 && leftP2 && leftP3 ? ([leftP1, leftP2, leftP3] as [Point3D, Point3D, Point3D]) : null;
-    const rightPoints = rightP1 && rightP2 && rightP3 ? ([rightP1, rightP2, rightP3] as [Point3D, Point3D, Point3D]) : null;
+  /**
+   * Calculate metrics and both position checks for a frame in one pass.
+   * The returned record is reused on the next call, so read its fields right away.
+   * If the tracked landmarks have not moved, the previous result is returned as is.
+   */
+  evaluateFrame(landmarks: PoseLandmark[]): FrameEvaluation {
+    const evaluation = this.frameEvaluation;
+    if (!this.trackMotion(landmarks)) {
+      return evaluation;
+    }
 
-    return calculateBilateralAngle(leftPoints, rightPoints) || 0;
+    const metrics = this.calculateMetrics(landmarks);
+    evaluation.metrics = metrics;
+    evaluation.isAtStart = this.startingPositionCheck(metrics);
+    evaluation.isAtRep = this.repPositionCheck(metrics);
+    return evaluation;
   }
 
   /**
-   * Calculate unilateral angle (single side)
+   * Compare the tracked landmarks with the last evaluated frame and record their
+   * positions when they moved. Returns false if the frame can reuse the last result.
    */
-  private calculateUnilateralAngleMetric(config: any): number {
-    const points = config.points as string[];
-    const side = config.side || 'left';
-
-    if (!points || points.length !== 3) return 0;
+  private trackMotion(landmarks: PoseLandmark[]): boolean {
+    const indices = this.trackedIndices;
 
-    const [p1, p2, p3] = points.map(p => this.joints[`${side}_${p.toLowerCase()}`]);
+    // Incomplete frames are always evaluated, and the next complete one too
+    if (landmarks.length < this.requiredLandmarkCount) {
+      this.lastTrackedPositions = null;
+      return true;
+    }
 
-    if (!p1 || !p2 || !p3) return 0;
+    let positions = this.lastTrackedPositions;
+    if (positions) {
+      let movement = 0;
+      for (let i = 0; i < indices.length && movement < MOTION_EPSILON; i++) {
+        const landmark = landmarks[indices[i]];
+        const offset = 3 * i;
+        movement += Math.abs(landmark.x - positions[offset]) +
+          Math.abs(landmark.y - positions[offset + 1]) +
+          Math.abs(landmark.z - positions[offset + 2]);
+      }
+      if (movement < MOTION_EPSILON) return false;
+    } else {
+      positions = this.lastTrackedPositions = new Float64Array(indices.length * 3);
+    }
 
-    return calculateAngle(p1, p2, p3);
+    for (let i = 0; i < indices.length; i++) {
+      const landmark = landmarks[indices[i]];
+      const offset = 3 * i;
+      positions[offset] = landmark.x;
+      positions[offset + 1] = landmark.y;
+      positions[offset + 2] = landmark.z;
+    }
+    return true;
   }
 
   /**
-   * Calculate vertical distance average (both sides)
+   * Fill the selection's scratch array with the current frame's landmarks.
+   * Returns null if the selection's joints could not be resolved.
    */
-  private calculateVerticalDistanceAverage(config: any): number {
-    const points = config.points as string[];
-    if (!points || points.length !== 2) return 0;
+  private getPoints(selection: LandmarkSelection | null): Point3D[] | null {
+    if (!selection) return null;
 
-    const [p1Name, p2Name] = points;
-    const distances: number[] = [];
+    const { indices, points } = selection;
+    for (let i = 0; i < indices.length; i++) {
+      points[i] = this.landmarks[indices[i]];
+    }
+    return points;
+  }
+
+  /**
+   * Average a measurement over the left and right sides, using whichever sides are visible.
+   * Returns 0 if neither side is visible.
+   */
+  private averageSides(
+    left: LandmarkSelection | null,
+    right: LandmarkSelection | null,
+    measure: SideMeasure
+  ): number {
+    let sum = 0;
+    let count = 0;
 
     // Left side
-    const leftP1 = this.joints[`left_${p1Name.toLowerCase()}`];
-    const leftP2 = this.joints[`left_${p2Name.toLowerCase()}`];
-    if (leftP1 && leftP2) {
-      distances.push(calculateVerticalDistance(leftP1, leftP2));
+    const leftPoints = this.getPoints(left);
+    if (leftPoints) {
+      sum += measure(leftPoints);
+      count++;
     }
 
     // Right side
-    const rightP1 = this.joints[`right_${p1Name.toLowerCase()}`];
-    const rightP2 = this.joints[`right_${p2Name.toLowerCase()}`];
-    if (rightP1 && rightP2) {
-      distances.push(calculateVerticalDistance(rightP1, rightP2));
+    const rightPoints = this.getPoints(right);
+    if (rightPoints) {
+      sum += measure(rightPoints);
+      count++;
     }
 
-    if (distances.length === 0) return 0;
+    return count === 0 ? 0 : sum / count;
+  }
+
+  /**
+   * Calculate unilateral angle (single side)
+   */
+  private calculateUnilateralAngleMetric(selection: LandmarkSelection | null): number {
+    const points = this.getPoints(selection);
+    if (!points) return 0;
 
-    const avgDistance = distances.reduce((sum, d) => sum + d, 0) / distances.length;
-    return config.absolute ? Math.abs(avgDistance) : avgDistance;
+    return measureAngle(points);
   }
 
   /**
    * Get Y coordinate of a single joint
    */
-  private calculateSingleJointY(config: any): number {
-    const pointName = config.point;
-    const side = config.side || 'left';
-    const joint = this.joints[`${side}_${pointName.toLowerCase()}`];
-    return joint ? joint.y : 0;
+  private calculateSingleJointY(selection: LandmarkSelection | null): number {
+    const points = this.getPoints(selection);
+    return points ? points[0].y : 0;
   }
 
   /**
-   * Calculate 2D distance average (both sides)
+   * Calculate horizontal distance average
    */
-  private calculateDistance2DAverage(config: any): number {
-    const points = config.points as string[];
-    if (!points || points.length !== 2) return 0;
-
-    const [p1Name, p2Name] = points;
-    const distances: number[] = [];
-
-    // Left side
-    const leftP1 = this.joints[`left_${p1Name.toLowerCase()}`];
-    const leftP2 = this.joints[`left_${p2Name.toLowerCase()}`];
-    if (leftP1 && leftP2) {
-      distances.push(calculateDistance2D(leftP1, leftP2));
-    }
+  private calculateHorizontalDistanceAverage(wrists: LandmarkSelection): number {
+    const points = this.getPoints(wrists);
 
-    // Right side
-    const rightP1 = this.joints[`right_${p1Name.toLowerCase()}`];
-    const rightP2 = this.joints[`right_${p2Name.toLowerCase()}`];
-    if (rightP1 && rightP2) {
-      distances.push(calculateDistance2D(rightP1, rightP2));
-    }
+    if (!points) return 0;
+    return calculateHorizontalDistance(points[0], points[1]);
+  }
 
-    if (distances.length === 0) return 0;
-    return distances.reduce((sum, d) => sum + d, 0) / distances.length;
+  /**
+   * Evaluate conditions against metrics, with the same compiled predicates
+   * the position checks use
+   */
+  evaluateConditions(metrics: ExerciseMetrics, conditions: ExerciseCondition[]): boolean {
+    return this.compileConditions(conditions)(metrics);
   }
 
   /**
-   * Calculate horizontal distance average
+   * Compile conditions into a single predicate, so operators are resolved once
+   * per exercise instead of on every frame
    */
-  private calculateHorizontalDistanceAverage(config: any): number {
-    const leftWrist = this.joints['left_wrist'];
-    const rightWrist = this.joints['right_wrist'];
+  private compileConditions(conditions: ExerciseCondition[]): ConditionPredicate {
+    const predicates = conditions.map(condition => this.compileCondition(condition));
 
-    if (!leftWrist || !rightWrist) return 0;
-    return calculateHorizontalDistance(leftWrist, rightWrist);
+    return (metrics) => {
+      for (const predicate of predicates) {
+        if (!predicate(metrics)) return false;
+      }
+      return true;
+    };
   }
 
   /**
-   * Evaluate conditions against metrics
+   * Compile a single condition. A missing metric compares as undefined,
+   * which fails every operator just like the explicit check in exerciseConfig's evaluateConditions.
    */
-  evaluateConditions(metrics: ExerciseMetrics, conditions: ExerciseCondition[]): boolean {
-    for (const condition of conditions) {
-      const metricValue = metrics[condition.metric];
-      if (metricValue === undefined) return false;
-
-      const threshold = condition.value;
-
-      switch (condition.operator) {
-        case '>':
-          if (!(metricValue > threshold)) return false;
-          break;
-        case '<':
-          if (!(metricValue < threshold)) return false;
-          break;
-        case '>=':
-          if (!(metricValue >= threshold)) return false;
-          break;
-        case '<=':
-          if (!(metricValue <= threshold)) return false;
-          break;
-        case '==':
-          if (!(metricValue === threshold)) return false;
-          break;
-        case 'abs_>':
-          if (!(Math.abs(metricValue) > threshold)) return false;
-          break;
-        case 'abs_<':
-          if (!(Math.abs(metricValue) < threshold)) return false;
-          break;
-        default:
-          console.warn(`Unknown operator: ${condition.operator}`);
-          return false;
-      }
+  private compileCondition({ metric, operator, value: threshold }: ExerciseCondition): ConditionPredicate {
+    switch (operator) {
+      case '>':
+        return (metrics) => metrics[metric] > threshold;
+      case '<':
+        return (metrics) => metrics[metric] < threshold;
+      case '>=':
+        return (metrics) => metrics[metric] >= threshold;
+      case '<=':
+        return (metrics) => metrics[metric] <= threshold;
+      case '==':
+        return (metrics) => metrics[metric] === threshold;
+      case 'abs_>':
+        return (metrics) => Math.abs(metrics[metric]) > threshold;
+      case 'abs_<':
+        return (metrics) => Math.abs(metrics[metric]) < threshold;
+      default:
+        console.warn(`Unknown operator: ${operator}`);
+        return () => false;
     }
-
-    return true;
   }
 
   /**
    * Check if at starting position
    */
   isAtStartingPosition(metrics: ExerciseMetrics): boolean {
-    return this.evaluateConditions(
-      metrics,
-      this.config.positions.starting_position.conditions
-    );
+    return this.startingPositionCheck(metrics);
   }
 
   /**
    * Check if at rep position
    */
   isAtRepPosition(metrics: ExerciseMetrics): boolean {
-    return this.evaluateConditions(
-      metrics,
-      this.config.positions.rep_position.conditions
-    );
+    return this.repPositionCheck(metrics);
   }
 }
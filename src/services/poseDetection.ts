@@ -9,7 +9,7 @@ import { drawConnectors, drawLandmarks } from '@mediapipe/drawing_utils';
 import { PoseLandmark } from '../utils/exerciseMetrics';
 
 export interface PoseDetectionConfig {
-  modelComplexity?: 0 | 1 | 2; // 0=lite, 1=full (default), 2=heavy
+  modelComplexity?: 0 | 1 | 2; // 0=lite, 1=full, 2=heavy (default: getDefaultModelComplexity)
   smoothLandmarks?: boolean;
   minDetectionConfidence?: number;
   minTrackingConfidence?: number;
@@ -24,6 +24,89 @@ export interface PoseResults {
 
 export type PoseResultsCallback = (results: PoseResults | null) => void;
 
+interface FrameLayout {
+  videoWidth: number;
+  videoHeight: number;
+  canvasWidth: number;
+  canvasHeight: number;
+  drawWidth: number;
+  drawHeight: number;
+  offsetX: number;
+  offsetY: number;
+  barX: number;
+  barY: number;
+}
+
+// Longest edge of the frame handed to MediaPipe. The model runs on a 256px
+// input, so larger frames only add upload and resize cost; landmarks are
+// normalized so downscaling does not change their coordinates.
+const INFERENCE_MAX_DIMENSION = 640;
+
+// When the model was chosen automatically, step down to a cheaper one if
+// inference averages more than this per frame once the model has warmed up
+const INFERENCE_BUDGET_MS = 50;
+const INFERENCE_WARMUP_FRAMES = 30;
+// Once on the lite model, the last fallback is to run inference on every
+// other frame; skipped frames are still drawn with the previous landmarks
+const MAX_ADAPTIVE_INFERENCE_INTERVAL = 2;
+
+// Skeleton overlay styles, shared across frames instead of rebuilt per draw
+const CONNECTOR_STYLE = { color: '#00FF00', lineWidth: 4 };
+const LANDMARK_STYLE = { color: '#FF0000', lineWidth: 2, radius: 6 };
+
+/**
+ * Pick the default pose model for this device. Low-core or low-memory
+ * devices get the lite model, which is several times cheaper per frame
+ * than the full model and keeps live tracking responsive.
+ */
+export function getDefaultModelComplexity(): 0 | 1 {
+  if (typeof navigator === 'undefined') return 1;
+
+  const cores = navigator.hardwareConcurrency || 0;
+  const memoryGb = (navigator as Navigator & { deviceMemory?: number }).deviceMemory || 0;
+
+  if ((cores > 0 && cores <= 4) || (memoryGb > 0 && memoryGb <= 2)) {
+    return 0;
+  }
+  return 1;
+}
+
+/**
+ * Create the video element for a webcam or file source that the detector
+ * draws itself. It stays rendered, at 1px and fully transparent, instead of
+ * display:none: browsers only deliver requestVideoFrameCallback for frames
+ * they render, and may throttle or stop a video that is never displayed.
+ */
+function createOffscreenVideoElement(): HTMLVideoElement {
+  const videoElement = document.createElement('video');
+  Object.assign(videoElement.style, {
+    position: 'fixed',
+    top: '0',
+    left: '0',
+    width: '1px',
+    height: '1px',
+    opacity: '0',
+    pointerEvents: 'none',
+  });
+  document.body.appendChild(videoElement);
+  return videoElement;
+}
+
+// The MediaPipe Pose graph (WASM runtime plus model) is expensive to load, so
+// one instance is kept for the page and handed to each detector in turn
+let sharedPose: Pose | null = null;
+
+function getSharedPose(): Pose {
+  if (!sharedPose) {
+    sharedPose = new Pose({
+      locateFile: (file) => {
+        return `https://cdn.jsdelivr.net/npm/@mediapipe/pose/${file}`;
+      },
+    });
+  }
+  return sharedPose;
+}
+
 /**
  * Client-side pose detector using MediaPipe WASM
  */
@@ -31,11 +114,25 @@ export class ClientSidePoseDetector {
   private pose: Pose | null = null;
   private camera: Camera | null = null;
   private videoElement: HTMLVideoElement | null = null;
+  private ownsVideoElement = false;
+  private videoObjectUrl: string | null = null;
   private canvasElement: HTMLCanvasElement | null = null;
+  private canvasContext: CanvasRenderingContext2D | null = null;
+  private frameLayout: FrameLayout | null = null;
+  private inferenceCanvas: HTMLCanvasElement | null = null;
+  private inferenceContext: CanvasRenderingContext2D | null = null;
   private onResultsCallback: PoseResultsCallback | null = null;
   private isInitialized = false;
   private isRunning = false;
   private drawingEnabled = true;
+  private videoNotReadyLogged = false;
+  private modelComplexity: 0 | 1 | 2 = 1;
+  private adaptiveModel = false;
+  private inferenceFrames = 0;
+  private inferenceTimeAvg = 0;
+  // Run inference on every Nth new video frame; only raised by the adaptive fallback
+  private inferenceInterval = 1;
+  private lastResults: Results | null = null;
 
   constructor(config: PoseDetectionConfig = {}) {
     this.drawingEnabled = config.showAdvancedMode ?? false;
@@ -46,28 +143,72 @@ export class ClientSidePoseDetector {
    * Initialize MediaPipe Pose
    */
   private initializePose(config: PoseDetectionConfig): void {
-    this.pose = new Pose({
-      locateFile: (file) => {
-        return `https://cdn.jsdelivr.net/npm/@mediapipe/pose/${file}`;
-      },
+    this.pose = getSharedPose();
+    // Clear tracking state left over from a previous detector
+    this.pose.reset();
+
+    this.applyOptions(config);
+
+    this.pose.onResults((results: Results) => {
+      this.handleResults(results);
     });
+  }
+
+  /**
+   * Apply options to MediaPipe, resolving the model for this device if not given
+   */
+  private applyOptions(config: PoseDetectionConfig): void {
+    if (!this.pose) return;
+
+    this.modelComplexity = config.modelComplexity ?? getDefaultModelComplexity();
+    this.adaptiveModel = config.modelComplexity === undefined;
+    this.inferenceFrames = 0;
+    this.inferenceTimeAvg = 0;
+    this.inferenceInterval = 1;
 
     this.pose.setOptions({
-      modelComplexity: config.modelComplexity ?? 1,
+      modelComplexity: this.modelComplexity,
       smoothLandmarks: config.smoothLandmarks ?? true,
       minDetectionConfidence: config.minDetectionConfidence ?? 0.5,
       minTrackingConfidence: config.minTrackingConfidence ?? 0.5,
     });
+  }
 
-    this.pose.onResults((results: Results) => {
-      this.handleResults(results);
-    });
+  /**
+   * Track inference time and fall back to a lighter model, then to skipping
+   * frames, when over budget
+   */
+  private recordInferenceTime(elapsedMs: number): void {
+    if (!this.adaptiveModel || !this.pose) return;
+    if (this.modelComplexity === 0 && this.inferenceInterval >= MAX_ADAPTIVE_INFERENCE_INTERVAL) return;
+
+    this.inferenceFrames++;
+    this.inferenceTimeAvg += (elapsedMs - this.inferenceTimeAvg) * 0.1;
+
+    if (this.inferenceFrames >= INFERENCE_WARMUP_FRAMES && this.inferenceTimeAvg > INFERENCE_BUDGET_MS) {
+      if (this.modelComplexity === 0) {
+        this.inferenceInterval++;
+        console.log(`[ClientSidePoseDetector] Inference averaging ${this.inferenceTimeAvg.toFixed(1)}ms on the lite model, running every ${this.inferenceInterval} frames`);
+        this.inferenceFrames = 0;
+        this.inferenceTimeAvg = 0;
+        return;
+      }
+
+      const fallback = (this.modelComplexity - 1) as 0 | 1;
+      console.log(`[ClientSidePoseDetector] Inference averaging ${this.inferenceTimeAvg.toFixed(1)}ms, falling back to model complexity ${fallback}`);
+      this.modelComplexity = fallback;
+      this.inferenceFrames = 0;
+      this.inferenceTimeAvg = 0;
+      this.pose.setOptions({ modelComplexity: fallback });
+    }
   }
 
   /**
    * Handle pose detection results
    */
   private handleResults(results: Results): void {
+    this.lastResults = results;
+
     // Always draw video on canvas
     if (this.canvasElement) {
       this.drawPose(results);
@@ -88,78 +229,180 @@ export class ClientSidePoseDetector {
       return null;
     }
 
+    // MediaPipe hands over freshly built landmark lists for every result, so
+    // they are passed through as-is rather than copied point by point
     return {
-      landmarks: results.poseLandmarks.map((lm) => ({
-        x: lm.x,
-        y: lm.y,
-        z: lm.z,
-        visibility: lm.visibility,
-      })),
-      worldLandmarks: results.poseWorldLandmarks
-        ? results.poseWorldLandmarks.map((lm) => ({
-            x: lm.x,
-            y: lm.y,
-            z: lm.z,
-            visibility: lm.visibility,
-          }))
-        : [],
+      landmarks: results.poseLandmarks,
+      worldLandmarks: results.poseWorldLandmarks ?? [],
       timestamp: Date.now(),
     };
   }
 
+  /**
+   * Start loading the MediaPipe runtime and model ahead of the first frame,
+   * so it overlaps camera or video startup instead of stalling the first send
+   */
+  async warmUp(): Promise<void> {
+    if (!this.pose) return;
+
+    try {
+      await this.pose.initialize();
+    } catch (err) {
+      console.warn('[ClientSidePoseDetector] Model warm-up failed:', err);
+    }
+  }
+
+  /**
+   * Send a video frame to MediaPipe
+   */
+  private async sendFrame(videoElement: HTMLVideoElement): Promise<void> {
+    if (!this.pose) return;
+
+    const startTime = performance.now();
+    await this.pose.send({ image: this.getInferenceImage(videoElement) });
+    this.recordInferenceTime(performance.now() - startTime);
+  }
+
+  /**
+   * Get the image to run inference on, downscaled if it exceeds INFERENCE_MAX_DIMENSION
+   */
+  private getInferenceImage(videoElement: HTMLVideoElement): HTMLVideoElement | HTMLCanvasElement {
+    const { videoWidth, videoHeight } = videoElement;
+    const scale = INFERENCE_MAX_DIMENSION / Math.max(videoWidth, videoHeight);
+
+    if (!(scale < 1)) {
+      return videoElement;
+    }
+
+    if (!this.inferenceCanvas) {
+      this.inferenceCanvas = document.createElement('canvas');
+      this.inferenceContext = this.inferenceCanvas.getContext('2d', { alpha: false });
+    }
+    const ctx = this.inferenceContext;
+    if (!ctx) {
+      return videoElement;
+    }
+
+    const width = Math.round(videoWidth * scale);
+    const height = Math.round(videoHeight * scale);
+    if (this.inferenceCanvas.width !== width || this.inferenceCanvas.height !== height) {
+      this.inferenceCanvas.width = width;
+      this.inferenceCanvas.height = height;
+    }
+
+    ctx.drawImage(videoElement, 0, 0, width, height);
+    return this.inferenceCanvas;
+  }
+
+  /**
+   * Get the 2D context for the output canvas, looked up once per canvas
+   */
+  private getCanvasContext(): CanvasRenderingContext2D | null {
+    if (!this.canvasContext && this.canvasElement) {
+      // Frames are always painted edge to edge, so an opaque backing store
+      // lets the browser skip alpha blending when compositing the canvas
+      this.canvasContext = this.canvasElement.getContext('2d', { alpha: false });
+    }
+    return this.canvasContext;
+  }
+
+  /**
+   * Get where the video sits on the canvas, recomputed only when either size changes
+   */
+  private getFrameLayout(videoElement: HTMLVideoElement, canvasElement: HTMLCanvasElement): FrameLayout {
+    const { videoWidth, videoHeight } = videoElement;
+    const { width: canvasWidth, height: canvasHeight } = canvasElement;
+    const cached = this.frameLayout;
+
+    if (
+      cached &&
+      cached.videoWidth === videoWidth &&
+      cached.videoHeight === videoHeight &&
+      cached.canvasWidth === canvasWidth &&
+      cached.canvasHeight === canvasHeight
+    ) {
+      return cached;
+    }
+
+    // Calculate dimensions to maintain aspect ratio (contain fit)
+    const videoAspect = videoWidth / videoHeight;
+    const canvasAspect = canvasWidth / canvasHeight;
+    
+    let drawWidth = canvasWidth;
+    let drawHeight = canvasHeight;
+    let offsetX = 0;
+    let offsetY = 0;
+    
+    if (canvasAspect > videoAspect) {
+      // Canvas is wider - add pillarboxes (black bars on sides)
+      drawWidth = canvasHeight * videoAspect;
+      offsetX = (canvasWidth - drawWidth) / 2;
+    } else {
+      // Canvas is taller - add letterboxes (black bars on top/bottom)
+      drawHeight = canvasWidth / videoAspect;
+      offsetY = (canvasHeight - drawHeight) / 2;
+    }
+
+    this.frameLayout = {
+      videoWidth,
+      videoHeight,
+      canvasWidth,
+      canvasHeight,
+      drawWidth,
+      drawHeight,
+      offsetX,
+      offsetY,
+      barX: Math.ceil(offsetX),
+      barY: Math.ceil(offsetY),
+    };
+    return this.frameLayout;
+  }
+
   /**
    * Draw pose landmarks and connections on canvas
    */
   private drawPose(results: Results): void {
     if (!this.canvasElement) return;
 
-    const ctx = this.canvasElement.getContext('2d');
+    const ctx = this.getCanvasContext();
     if (!ctx) return;
 
-    // Clear canvas
+    // Every branch below paints the full canvas, so no separate clear pass is needed
     ctx.save();
-    ctx.clearRect(0, 0, this.canvasElement.width, this.canvasElement.height);
 
     // Draw the video frame with aspect ratio preservation
     if (this.videoElement && this.videoElement.readyState >= 2) {
+      this.videoNotReadyLogged = false;
       try {
-        // Calculate dimensions to maintain aspect ratio (contain fit)
-        const videoAspect = this.videoElement.videoWidth / this.videoElement.videoHeight;
-        const canvasAspect = this.canvasElement.width / this.canvasElement.height;
-        
-        let drawWidth = this.canvasElement.width;
-        let drawHeight = this.canvasElement.height;
-        let offsetX = 0;
-        let offsetY = 0;
-        
-        if (canvasAspect > videoAspect) {
-          // Canvas is wider - add pillarboxes (black bars on sides)
-          drawWidth = this.canvasElement.height * videoAspect;
-          offsetX = (this.canvasElement.width - drawWidth) / 2;
-        } else {
-          // Canvas is taller - add letterboxes (black bars on top/bottom)
-          drawHeight = this.canvasElement.width / videoAspect;
-          offsetY = (this.canvasElement.height - drawHeight) / 2;
-        }
-        
-        // Fill black background (for letterboxing/pillarboxing)
+        const { width, height } = this.canvasElement;
+        const layout = this.getFrameLayout(this.videoElement, this.canvasElement);
+
+        // Fill only the letterbox/pillarbox bars; the video covers the rest
         ctx.fillStyle = '#000000';
-        ctx.fillRect(0, 0, this.canvasElement.width, this.canvasElement.height);
+        if (layout.barX > 0) {
+          ctx.fillRect(0, 0, layout.barX, height);
+          ctx.fillRect(width - layout.barX, 0, layout.barX, height);
+        }
+        if (layout.barY > 0) {
+          ctx.fillRect(0, 0, width, layout.barY);
+          ctx.fillRect(0, height - layout.barY, width, layout.barY);
+        }
         
         // Draw video maintaining aspect ratio
         ctx.drawImage(
           this.videoElement,
-          offsetX,
-          offsetY,
-          drawWidth,
-          drawHeight
+          layout.offsetX,
+          layout.offsetY,
+          layout.drawWidth,
+          layout.drawHeight
         );
       } catch (err) {
         console.warn('[PoseDetection] Error drawing video frame:', err);
       }
     } else {
-      // Fill with black if video not ready
-      if (this.videoElement) {
+      // Fill with black if video not ready, warning once per stall rather than every frame
+      if (this.videoElement && !this.videoNotReadyLogged) {
+        this.videoNotReadyLogged = true;
         console.warn('[PoseDetection] Video not ready, readyState:', this.videoElement.readyState, 'paused:', this.videoElement.paused, 'currentTime:', this.videoElement.currentTime);
       }
       ctx.fillStyle = '#000000';
@@ -169,22 +412,57 @@ export class ClientSidePoseDetector {
     // Draw pose if detected and advanced mode enabled
     if (results.poseLandmarks && this.drawingEnabled) {
       // Draw connections
-      drawConnectors(ctx, results.poseLandmarks, POSE_CONNECTIONS, {
-        color: '#00FF00',
-        lineWidth: 4,
-      });
+      drawConnectors(ctx, results.poseLandmarks, POSE_CONNECTIONS, CONNECTOR_STYLE);
 
       // Draw landmarks
-      drawLandmarks(ctx, results.poseLandmarks, {
-        color: '#FF0000',
-        lineWidth: 2,
-        radius: 6,
-      });
+      drawLandmarks(ctx, results.poseLandmarks, LANDMARK_STYLE);
     }
 
     ctx.restore();
   }
 
+  /**
+   * Run inference on each new frame the video presents, until stopped.
+   * Frames that arrive while inference is busy are dropped rather than queued.
+   */
+  private startFrameLoop(videoElement: HTMLVideoElement): void {
+    // Wake up only when the video has presented a new frame. Browsers without
+    // requestVideoFrameCallback fall back to animation frames, skipping ticks
+    // where the playback position has not moved.
+    const supportsFrameCallback = 'requestVideoFrameCallback' in videoElement;
+    let lastFrameTime = -1;
+    let newFrames = 0;
+
+    const scheduleFrame = () => {
+      if (supportsFrameCallback) {
+        videoElement.requestVideoFrameCallback(processFrame);
+      } else {
+        requestAnimationFrame(processFrame);
+      }
+    };
+
+    const processFrame = async () => {
+      if (!this.isRunning || !this.pose || this.videoElement !== videoElement) return;
+
+      if (!videoElement.paused && !videoElement.ended) {
+        if (videoElement.currentTime !== lastFrameTime) {
+          lastFrameTime = videoElement.currentTime;
+          if (newFrames++ % this.inferenceInterval === 0) {
+            await this.sendFrame(videoElement);
+          } else if (this.lastResults) {
+            // Keep the video smooth on skipped frames, reusing the last landmarks
+            this.drawPose(this.lastResults);
+          }
+        }
+        scheduleFrame();
+      } else {
+        console.warn('[PoseDetection] Frame processing stopped - paused:', videoElement.paused, 'ended:', videoElement.ended);
+      }
+    };
+
+    processFrame();
+  }
+
   /**
    * Start pose detection from video file
    */
@@ -198,20 +476,20 @@ export class ClientSidePoseDetector {
     }
 
     // Create video element for file
-    const videoElement = document.createElement('video');
-    videoElement.style.display = 'none';
+    const videoElement = createOffscreenVideoElement();
     videoElement.preload = 'auto';
     videoElement.playsInline = true;
     videoElement.muted = true; // Mute to allow autoplay
     videoElement.loop = true; // Enable looping
-    document.body.appendChild(videoElement);
 
     this.videoElement = videoElement;
+    this.ownsVideoElement = true;
     this.canvasElement = canvasElement;
     this.onResultsCallback = onResults;
 
     // Load video file
     const videoUrl = URL.createObjectURL(videoFile);
+    this.videoObjectUrl = videoUrl;
     videoElement.src = videoUrl;
 
     // Wait for video metadata to load with timeout
@@ -252,19 +530,8 @@ export class ClientSidePoseDetector {
     // Process frames manually
     this.isRunning = true;
     this.isInitialized = true;
+    this.startFrameLoop(videoElement);
 
-    const processFrame = async () => {
-      if (!this.isRunning || !this.pose || !videoElement) return;
-
-      if (!videoElement.paused && !videoElement.ended) {
-        await this.pose.send({ image: videoElement });
-        requestAnimationFrame(processFrame);
-      } else {
-        console.warn('[PoseDetection] Frame processing stopped - paused:', videoElement.paused, 'ended:', videoElement.ended);
-      }
-    };
-
-    processFrame();
     console.log('[ClientSidePoseDetector] Started from video file');
   }
 
@@ -292,7 +559,7 @@ export class ClientSidePoseDetector {
     this.camera = new Camera(videoElement, {
       onFrame: async () => {
         if (this.pose && this.isRunning) {
-          await this.pose.send({ image: videoElement });
+          await this.sendFrame(videoElement);
         }
       },
       width: 1280,
@@ -318,11 +585,10 @@ export class ClientSidePoseDetector {
     }
 
     // Create hidden video element for webcam
-    const videoElement = document.createElement('video');
-    videoElement.style.display = 'none';
-    document.body.appendChild(videoElement);
+    const videoElement = createOffscreenVideoElement();
 
     this.videoElement = videoElement;
+    this.ownsVideoElement = true;
     this.canvasElement = canvasElement;
     this.onResultsCallback = onResults;
 
@@ -342,20 +608,11 @@ export class ClientSidePoseDetector {
     canvasElement.width = videoElement.videoWidth || 1280;
     canvasElement.height = videoElement.videoHeight || 720;
 
-    // Initialize camera
-    this.camera = new Camera(videoElement, {
-      onFrame: async () => {
-        if (this.pose && this.isRunning) {
-          await this.pose.send({ image: videoElement });
-        }
-      },
-      width: 1280,
-      height: 720,
-    });
-
-    await this.camera.start();
+    // Drive inference from the stream we already opened; the camera_utils
+    // helper would request the webcam a second time and tick at display rate
     this.isRunning = true;
     this.isInitialized = true;
+    this.startFrameLoop(videoElement);
 
     console.log('[ClientSidePoseDetector] Started from webcam');
   }
@@ -377,13 +634,29 @@ export class ClientSidePoseDetector {
       if (stream) {
         stream.getTracks().forEach((track) => track.stop());
       }
-      if (this.videoElement.style.display === 'none') {
+      if (this.ownsVideoElement) {
         this.videoElement.parentNode.removeChild(this.videoElement);
       }
     }
 
+    // Release the blob backing a video file source
+    if (this.videoObjectUrl) {
+      if (this.videoElement) {
+        this.videoElement.removeAttribute('src');
+        this.videoElement.load();
+      }
+      URL.revokeObjectURL(this.videoObjectUrl);
+      this.videoObjectUrl = null;
+    }
+
     this.videoElement = null;
+    this.ownsVideoElement = false;
     this.canvasElement = null;
+    this.canvasContext = null;
+    this.frameLayout = null;
+    this.inferenceCanvas = null;
+    this.inferenceContext = null;
+    this.lastResults = null;
     this.onResultsCallback = null;
     this.isInitialized = false;
 
@@ -401,14 +674,7 @@ export class ClientSidePoseDetector {
    * Update pose detection options
    */
   updateOptions(config: PoseDetectionConfig): void {
-    if (this.pose) {
-      this.pose.setOptions({
-        modelComplexity: config.modelComplexity ?? 1,
-        smoothLandmarks: config.smoothLandmarks ?? true,
-        minDetectionConfidence: config.minDetectionConfidence ?? 0.5,
-        minTrackingConfidence: config.minTrackingConfidence ?? 0.5,
-      });
-    }
+    this.applyOptions(config);
   }
 
   /**
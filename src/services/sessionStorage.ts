@@ -126,35 +126,42 @@ export async function logRep(
   quality: string
 ): Promise<WorkoutSession> {
   const db = await initDB();
-  const session = await getSession(sessionId);
 
-  if (!session) {
-    throw new Error('Session not found');
-  }
+  // Read and update the session in a single readwrite transaction, so each rep
+  // costs one transaction and reps logged back to back cannot overwrite each other
+  return new Promise((resolve, reject) => {
+    const transaction = db.transaction([SESSIONS_STORE], 'readwrite');
+    const store = transaction.objectStore(SESSIONS_STORE);
+    const getRequest = store.get(sessionId);
 
-  const repData: RepData = {
-    rep_number: session.total_reps + 1,
-    metrics,
-    quality,
-    timestamp: Date.now()
-  };
+    getRequest.onsuccess = () => {
+      const session: WorkoutSession | undefined = getRequest.result;
+      if (!session) {
+        reject(new Error('Session not found'));
+        return;
+      }
 
-  session.reps.push(repData);
-  session.total_reps += 1;
+      const repData: RepData = {
+        rep_number: session.total_reps + 1,
+        metrics,
+        quality,
+        timestamp: Date.now()
+      };
 
-  // Check if set is complete
-  const repsPerSet = session.plan.reps_per_set || 0;
-  if (repsPerSet > 0 && session.total_reps % repsPerSet === 0) {
-    session.completed_sets += 1;
-  }
+      session.reps.push(repData);
+      session.total_reps += 1;
 
-  return new Promise((resolve, reject) => {
-    const transaction = db.transaction([SESSIONS_STORE], 'readwrite');
-    const store = transaction.objectStore(SESSIONS_STORE);
-    const request = store.put(session);
+      // Check if set is complete
+      const repsPerSet = session.plan.reps_per_set || 0;
+      if (repsPerSet > 0 && session.total_reps % repsPerSet === 0) {
+        session.completed_sets += 1;
+      }
 
-    request.onsuccess = () => resolve(session);
-    request.onerror = () => reject(request.error);
+      const putRequest = store.put(session);
+      putRequest.onsuccess = () => resolve(session);
+      putRequest.onerror = () => reject(putRequest.error);
+    };
+    getRequest.onerror = () => reject(getRequest.error);
   });
 }
 
@@ -10,8 +10,10 @@
  * - Offline support after initial load
  */
 
-import Tesseract, { createWorker, RecognizeResult } from 'tesseract.js';
-import { getExercises } from './exerciseConfig';
+import type Tesseract from 'tesseract.js';
+import type { RecognizeResult } from 'tesseract.js';
+import { getExercises, ExerciseDefinition } from './exerciseConfig';
+import { computeFrameHash, FrameDeduplicator, FRAME_DETAIL_HASH_SIZE } from '../utils/frameHash';
 
 export interface WorkoutExercise {
   exercise: string;
@@ -37,15 +39,109 @@ export interface ScanResult {
   raw_text: string;
 }
 
+// Words that mark a line as exercise-like, compiled into a single alternation
+// so each candidate name is scanned once instead of once per keyword
+const EXERCISE_KEYWORDS = [
+  // Equipment
+  'barbell', 'dumbbell', 'cable', 'machine', 'kettlebell', 'band',
+  // Exercise types
+  'squat', 'press', 'raise', 'curl', 'row', 'lunge', 'deadlift', 
+  'fly', 'pull', 'push', 'step', 'crunch', 'plank', 'extension',
+  'kickback', 'shrug', 'twist', 'bend', 'lift', 'dip',
+  // Body parts
+  'leg', 'chest', 'shoulder', 'back', 'bicep', 'tricep', 'arm',
+  'glute', 'hamstring', 'quad', 'calf', 'ab', 'core', 'hip',
+  // Common words
+  'bench', 'incline', 'decline', 'lateral', 'front', 'side',
+  'overhead', 'seated', 'standing', 'lying', 'prone', 'supine'
+];
+const EXERCISE_KEYWORD_PATTERN = new RegExp(EXERCISE_KEYWORDS.join('|'));
+
+const COMMON_WORDS = new Set(['set', 'rep', 'rest', 'warm', 'cool', 'down', 'up', 'the', 'and', 'or']);
+
+// Generic-format parsing tables, built once rather than per OCR line.
+// Skip keywords are escaped into one alternation so a line is scanned once.
+const GENERIC_SKIP_KEYWORDS = [
+  'click', 'print', 'free', 'discover', 'more', 'tools',
+  'workoutlabs', 'www.', 'http', '...and', 'exercises',
+  'view', 'fitness', 'simple', 'wl'
+];
+const GENERIC_SKIP_PATTERN = new RegExp(
+  GENERIC_SKIP_KEYWORDS.map(k => k.replace(/[.*+?^${}()|[\]\\]/g, '\\$&')).join('|')
+);
+
+const GENERIC_DAY_HEADERS = new Set(['leg day', 'arm day', 'chest day', 'back day']);
+
+// Pattern variations for sets/reps (very lenient for OCR).
+// repsFirst marks patterns whose first capture is the rep count.
+const GENERIC_SETS_REPS_PATTERNS: { pattern: RegExp; repsFirst: boolean }[] = [
+  // Standard patterns
+  { pattern: /(\d+)\s*[sS]ets?\s*[·•.·\-×x,:\s]+\s*(\d+)\s*[rR]eps?/i, repsFirst: false },
+  // Just numbers with separators
+  { pattern: /(\d+)\s*[·•.—×x]\s*(\d+)(?!\d)/, repsFirst: false },
+  // Sets/reps in any order
+  { pattern: /(\d+)\s*reps?\s*[·•.·\-×x,:\s]+\s*(\d+)\s*sets?/i, repsFirst: true },
+];
+
+// FitBod-format parsing tables and patterns, hoisted out of the per-line loop
+const FITBOD_HEADER_LINES = new Set(['Start Workout', 'Body Targets Log', 'Target Muscles', 'FOCUS']);
+
+// Skip common non-exercise lines (one case-insensitive scan instead of lowercasing per keyword)
+const FITBOD_SKIP_PATTERN = new RegExp([
+  'workout', 'swap', 'exercises', 'your gym', 'intermediate',
+  'target muscles', 'abs glutes', 'quadrice', 'superset', 'rounds', 'focus'
+].join('|'), 'i');
+
+// Exercise name patterns
+const FITBOD_TITLE_CASE_NAME = /([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)/;
+const FITBOD_ALL_CAPS_NAME = /([A-Z]{2,}(?:\s+[A-Z]{2,})+)/;
+const FITBOD_MIXED_CASE_NAME = /^([A-Za-z]+(?:\s+[A-Za-z]+)+)(?:\s|$)/;
+
+// Cheap gate before the workout data pattern: data lines always contain a digit
+const HAS_DIGIT = /\d/;
+
+// Workout data pattern: sets followed by one of, in order of preference,
+// reps + weight ("4 sets × 8 reps × 60 kg"), time ("3 sets × 0:45") or reps only
+const FITBOD_WORKOUT_DATA = new RegExp(
+  '(?<sets>\\d+)\\s*[Ss]ets?\\s*(?:' +
+    '[+»×xX*\\-«>°:]+\\s*(?<weightedReps>\\d+)\\s*[Rr]eps?\\s*[+»×xX*\\-«>°:]+\\s*(?<weight>\\d+(?:\\.\\d+)?)\\s*k' +
+    '|[+»×xX*\\-«>°]+\\s*(?:(?<minutes>\\d+):(?<seconds>\\d+)|(?<reps>\\d+)\\s*[Rr]eps?)' +
+  ')'
+);
+
+// Longest edge, in pixels, of video frames sent to OCR. Phone recordings are
+// often 1080p or larger, and recognition time grows with pixel count while
+// app text stays legible well below full resolution
+const MAX_OCR_FRAME_DIMENSION = 1200;
+
+// Upper bound on OCR workers; each holds its own copy of the language model
+const MAX_OCR_WORKERS = 4;
+
+/**
+ * Number of OCR workers to run. Each worker is a separate thread with its own
+ * WASM engine, so video frames can be recognized in parallel on multi-core
+ * devices. One worker per two cores leaves room for the main thread and video
+ * decoding, and low-core devices keep a single worker to limit memory use.
+ */
+function getOcrWorkerCount(): number {
+  const cores = typeof navigator !== 'undefined' ? navigator.hardwareConcurrency || 1 : 1;
+  return Math.max(1, Math.min(MAX_OCR_WORKERS, Math.floor(cores / 2)));
+}
+
 export class WorkoutScanner {
-  private worker: Tesseract.Worker | null = null;
+  private scheduler: Tesseract.Scheduler | null = null;
+  private workerCount = 1;
   private isInitialized = false;
+  // Creates an extra pool worker configured like the first; set once tesseract.js is loaded
+  private createPoolWorker: (() => Promise<Tesseract.Worker>) | null = null;
+  private poolGrowth: Promise<void> | null = null;
 
   /**
-   * Initialize the OCR worker
+   * Initialize the OCR scheduler with a single worker. Images only need one;
+   * processVideo adds the rest of the pool when a video is scanned.
    */
   async initialize(onProgress?: (progress: ScanProgress) => void): Promise<void> {
-    if (this.isInitialized && this.worker) {
+    if (this.isInitialized && this.scheduler) {
       return;
     }
 
@@ -56,28 +152,41 @@ export class WorkoutScanner {
         message: 'Creating OCR worker...'
       });
 
-      this.worker = await createWorker('eng', 1, {
-        logger: (m: any) => {
-          if (m.status === 'loading tesseract core' || m.status === 'initializing tesseract') {
-            onProgress?.({
-              status: 'loading',
-              progress: Math.round((m.progress || 0) * 50), // 0-50%
-              message: `Loading OCR engine... ${Math.round((m.progress || 0) * 100)}%`
-            });
-          } else if (m.status === 'loading language traineddata') {
-            onProgress?.({
-              status: 'loading',
-              progress: 50 + Math.round((m.progress || 0) * 50), // 50-100%
-              message: `Loading language data... ${Math.round((m.progress || 0) * 100)}%`
-            });
-          }
+      // Tesseract is only loaded once a scan is actually requested
+      const { createScheduler, createWorker, PSM } = await import('tesseract.js');
+
+      const logger = (m: any) => {
+        if (m.status === 'loading tesseract core' || m.status === 'initializing tesseract') {
+          onProgress?.({
+            status: 'loading',
+            progress: Math.round((m.progress || 0) * 50), // 0-50%
+            message: `Loading OCR engine... ${Math.round((m.progress || 0) * 100)}%`
+          });
+        } else if (m.status === 'loading language traineddata') {
+          onProgress?.({
+            status: 'loading',
+            progress: 50 + Math.round((m.progress || 0) * 50), // 50-100%
+            message: `Loading language data... ${Math.round((m.progress || 0) * 100)}%`
+          });
         }
-      });
+      };
 
-      // Configure for better accuracy with workout text
-      await this.worker.setParameters({
-        tessedit_pageseg_mode: Tesseract.PSM.AUTO,
-      });
+      // Configure for better accuracy with workout text. Only the first
+      // worker reports loading progress
+      const createConfiguredWorker = async (options: Partial<Tesseract.WorkerOptions> = {}) => {
+        const worker = await createWorker('eng', 1, options);
+        await worker.setParameters({
+          tessedit_pageseg_mode: PSM.AUTO,
+        });
+        return worker;
+      };
+
+      const worker = await createConfiguredWorker({ logger });
+
+      this.scheduler = createScheduler();
+      this.scheduler.addWorker(worker);
+      this.workerCount = 1;
+      this.createPoolWorker = () => createConfiguredWorker();
 
       this.isInitialized = true;
 
@@ -97,16 +206,56 @@ export class WorkoutScanner {
   }
 
   /**
-   * Terminate the worker and free resources
+   * Terminate the workers and free resources
    */
   async terminate(): Promise<void> {
-    if (this.worker) {
-      await this.worker.terminate();
-      this.worker = null;
+    if (this.scheduler) {
+      // Let a pool still growing add its workers, so the scheduler terminates them too
+      await this.poolGrowth;
+      await this.scheduler.terminate();
+      this.scheduler = null;
+      this.workerCount = 1;
       this.isInitialized = false;
+      this.createPoolWorker = null;
+      this.poolGrowth = null;
     }
   }
 
+  /**
+   * Grow the scheduler to the full worker pool for video scanning
+   */
+  private async ensureWorkerPool(onProgress?: (progress: ScanProgress) => void): Promise<void> {
+    if (!this.scheduler) {
+      await this.initialize(onProgress);
+    }
+
+    const missing = getOcrWorkerCount() - this.workerCount;
+    if (missing <= 0 || !this.createPoolWorker) {
+      return;
+    }
+
+    if (!this.poolGrowth) {
+      const scheduler = this.scheduler!;
+      const createPoolWorker = this.createPoolWorker;
+      // A worker that fails to start only costs parallelism; keep scanning with the rest
+      this.poolGrowth = Promise.allSettled(
+        Array.from({ length: missing }, () => createPoolWorker())
+      ).then(results => {
+        for (const result of results) {
+          if (result.status === 'fulfilled') {
+            scheduler.addWorker(result.value);
+            this.workerCount++;
+          } else {
+            console.warn('[WorkoutScanner] Failed to start additional OCR worker:', result.reason);
+          }
+        }
+      }).finally(() => {
+        this.poolGrowth = null;
+      });
+    }
+    await this.poolGrowth;
+  }
+
   /**
    * Preprocess image for better OCR results
    */
@@ -149,7 +298,7 @@ export class WorkoutScanner {
     imageSource: File | HTMLImageElement | HTMLVideoElement | HTMLCanvasElement,
     onProgress?: (progress: ScanProgress) => void
   ): Promise<string> {
-    if (!this.worker) {
+    if (!this.scheduler) {
       await this.initialize(onProgress);
     }
 
@@ -160,14 +309,11 @@ export class WorkoutScanner {
     });
 
     try {
-      const result = await this.worker!.recognize(imageSource);
+      const result: RecognizeResult = await this.scheduler!.addJob('recognize', imageSource);
       const text = result.data.text;
       
-      // Log OCR output for debugging
-      console.log('[WorkoutScanner] OCR extracted text:');
-      console.log('---START---');
-      console.log(text);
-      console.log('---END---');
+      // Log OCR output for debugging (one console write per recognized frame)
+      console.log(`[WorkoutScanner] OCR extracted text:\n---START---\n${text}\n---END---`);
 
       return text;
     } catch (error) {
@@ -182,11 +328,12 @@ export class WorkoutScanner {
 
   /**
    * Parse generic workout format (WorkoutLabs, etc.)
+   * Accepts raw OCR text or its already-split lines.
    */
-  parseGenericWorkoutFormat(text: string): WorkoutExercise[] {
+  parseGenericWorkoutFormat(text: string | string[]): WorkoutExercise[] {
     const exercises: WorkoutExercise[] = [];
     const seenExercises = new Set<string>();
-    const lines = text.split('\n');
+    const lines = typeof text === 'string' ? text.split('\n') : text;
 
     let i = 0;
     while (i < lines.length) {
@@ -196,14 +343,9 @@ export class WorkoutScanner {
       if (!line || line.length < 3) continue;
 
       // Skip non-exercise lines
-      const skipKeywords = [
-        'click', 'print', 'free', 'discover', 'more', 'tools',
-        'workoutlabs', 'www.', 'http', '...and', 'exercises',
-        'view', 'fitness', 'simple', 'wl'
-      ];
-
-      if (skipKeywords.some(k => line.toLowerCase().includes(k))) continue;
-      if (['leg day', 'arm day', 'chest day', 'back day'].includes(line.toLowerCase())) continue;
+      const lowerLine = line.toLowerCase();
+      if (GENERIC_SKIP_PATTERN.test(lowerLine)) continue;
+      if (GENERIC_DAY_HEADERS.has(lowerLine)) continue;
 
       // Check for exercise name patterns (more lenient for OCR errors)
       let exerciseName: string | null = null;
@@ -238,26 +380,11 @@ export class WorkoutScanner {
       for (const checkLine of linesToCheck) {
         if (!checkLine) continue;
 
-        // Pattern variations for sets/reps (very lenient for OCR)
-        const patterns = [
-          // Standard patterns
-          /(\d+)\s*[sS]ets?\s*[·•.·\-×x,:\s]+\s*(\d+)\s*[rR]eps?/i,
-          // Just numbers with separators
-          /(\d+)\s*[·•.—×x]\s*(\d+)(?!\d)/,
-          // Sets/reps in any order
-          /(\d+)\s*reps?\s*[·•.·\-×x,:\s]+\s*(\d+)\s*sets?/i,
-        ];
-
-        for (const pattern of patterns) {
+        for (const { pattern, repsFirst } of GENERIC_SETS_REPS_PATTERNS) {
           const match = checkLine.match(pattern);
           if (match) {
-            let sets = parseInt(match[1]);
-            let reps = parseInt(match[2]);
-            
-            // If pattern was reps first, swap them
-            if (pattern.source.includes('reps?.*sets?')) {
-              [sets, reps] = [reps, sets];
-            }
+            const sets = parseInt(repsFirst ? match[2] : match[1]);
+            const reps = parseInt(repsFirst ? match[1] : match[2]);
             
             // Sanity check: sets usually 1-10, reps usually 1-50
             if (sets > 0 && sets <= 20 && reps > 0 && reps <= 100) {
@@ -295,40 +422,37 @@ export class WorkoutScanner {
 
   /**
    * Parse FitBod format workout
+   * Accepts raw OCR text or its already-split lines.
    */
-  parseFitBodFormat(text: string): WorkoutExercise[] {
+  parseFitBodFormat(text: string | string[]): WorkoutExercise[] {
     const exercises: WorkoutExercise[] = [];
     const seenExercises = new Set<string>();
-    const lines = text.split('\n');
+    const lines = typeof text === 'string' ? text.split('\n') : text;
 
     let i = 0;
     while (i < lines.length) {
       const line = lines[i].trim();
       i++;
 
-      if (!line || ['Start Workout', 'Body Targets Log', 'Target Muscles', 'FOCUS'].includes(line)) {
+      if (!line || FITBOD_HEADER_LINES.has(line)) {
         continue;
       }
 
       // Skip common non-exercise lines
-      const skipKeywords = [
-        'workout', 'swap', 'exercises', 'your gym', 'intermediate',
-        'target muscles', 'abs glutes', 'quadrice', 'superset', 'rounds', 'focus'
-      ];
-      if (skipKeywords.some(k => line.toLowerCase().includes(k))) continue;
+      if (FITBOD_SKIP_PATTERN.test(line)) continue;
 
       // Look for exercise names (more patterns)
       let exerciseName: string | null = null;
       
       // Pattern 1: Title Case multi-word (e.g., "Barbell Squat")
-      let match = line.match(/([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)/);
+      let match = line.match(FITBOD_TITLE_CASE_NAME);
       if (match) {
         exerciseName = match[1].trim();
       }
       
       // Pattern 2: All caps multi-word (e.g., "BENCH PRESS")
       if (!exerciseName) {
-        match = line.match(/([A-Z]{2,}(?:\s+[A-Z]{2,})+)/);
+        match = line.match(FITBOD_ALL_CAPS_NAME);
         if (match) {
           exerciseName = match[1].trim();
         }
@@ -336,7 +460,7 @@ export class WorkoutScanner {
       
       // Pattern 3: Mixed case (e.g., "Cable Row" or "DB Curl")
       if (!exerciseName) {
-        match = line.match(/^([A-Za-z]+(?:\s+[A-Za-z]+)+)(?:\s|$)/);
+        match = line.match(FITBOD_MIXED_CASE_NAME);
         if (match && !/^\d/.test(match[1]) && this.looksLikeExercise(match[1])) {
           exerciseName = match[1].trim();
         }
@@ -353,39 +477,30 @@ export class WorkoutScanner {
       for (let lookahead = 0; lookahead < 2 && i + lookahead < lines.length; lookahead++) {
         const nextLine = lines[i + lookahead].trim();
 
-        if (nextLine.length < 5 || !/\d/.test(nextLine)) continue;
+        if (nextLine.length < 5 || !HAS_DIGIT.test(nextLine)) continue;
 
-        // Pattern 1: Sets + Reps + Weight
-        let match = nextLine.match(/(\d+)\s*[Ss]ets?\s*[+»×xX*\-«>°:]+\s*(\d+)\s*[Rr]eps?\s*[+»×xX*\-«>°:]+\s*(\d+(?:\.\d+)?)\s*k/);
-        if (match) {
-          exerciseData = {
-            exercise: exerciseName,
-            sets: parseInt(match[1]),
-            reps: parseInt(match[2]),
-            weight_kg: parseFloat(match[3])
-          };
-        }
-
-        // Pattern 2: Sets + Time only
-        if (!exerciseData) {
-          match = nextLine.match(/(\d+)\s*[Ss]ets?\s*[+»×xX*\-«>°]+\s*(\d+):(\d+)/);
-          if (match) {
+        // One search covers sets + reps + weight, sets + time and sets + reps
+        const groups = nextLine.match(FITBOD_WORKOUT_DATA)?.groups;
+        if (groups) {
+          const sets = parseInt(groups.sets);
+          if (groups.weight !== undefined) {
             exerciseData = {
               exercise: exerciseName,
-              sets: parseInt(match[1]),
-              duration: `${match[2]}:${match[3].padStart(2, '0')}`
+              sets,
+              reps: parseInt(groups.weightedReps),
+              weight_kg: parseFloat(groups.weight)
             };
-          }
-        }
-
-        // Pattern 3: Sets + Reps only
-        if (!exerciseData) {
-          match = nextLine.match(/(\d+)\s*[Ss]ets?\s*[+»×xX*\-«>°]+\s*(\d+)\s*[Rr]eps?/);
-          if (match) {
+          } else if (groups.minutes !== undefined) {
             exerciseData = {
               exercise: exerciseName,
-              sets: parseInt(match[1]),
-              reps: parseInt(match[2])
+              sets,
+              duration: `${groups.minutes}:${groups.seconds.padStart(2, '0')}`
+            };
+          } else {
+            exerciseData = {
+              exercise: exerciseName,
+              sets,
+              reps: parseInt(groups.reps)
             };
           }
         }
@@ -406,9 +521,12 @@ export class WorkoutScanner {
    */
   parseWorkoutText(text: string): { exercises: WorkoutExercise[]; format: string } {
     console.log('[WorkoutScanner] Parsing workout text...');
+
+    // Split once and share the lines between both parsers
+    const lines = text.split('\n');
     
     // Try FitBod format first
-    const fitbodExercises = this.parseFitBodFormat(text);
+    const fitbodExercises = this.parseFitBodFormat(lines);
     console.log(`[WorkoutScanner] FitBod format found ${fitbodExercises.length} exercises:`, fitbodExercises);
 
     // Check if FitBod found good results
@@ -422,7 +540,7 @@ export class WorkoutScanner {
     }
 
     // Try generic format
-    const genericExercises = this.parseGenericWorkoutFormat(text);
+    const genericExercises = this.parseGenericWorkoutFormat(lines);
     console.log(`[WorkoutScanner] Generic format found ${genericExercises.length} exercises:`, genericExercises);
 
     // Return whichever found more
@@ -454,27 +572,7 @@ export class WorkoutScanner {
     // Extract text
     const text = await this.extractText(file, onProgress);
 
-    onProgress?.({
-      status: 'processing',
-      progress: 100,
-      message: 'Parsing workout data...'
-    });
-
-    // Parse workout
-    const { exercises, format } = this.parseWorkoutText(text);
-
-    // Match exercises to database
-    const matchedExercises = await this.matchExercises(exercises);
-
-    return {
-      source: file.name,
-      source_type: 'image',
-      detected_format: format as any,
-      total_exercises: matchedExercises.length,
-      timestamp: new Date().toISOString(),
-      exercises: matchedExercises,
-      raw_text: text
-    };
+    return this.buildScanResult(file.name, 'image', text, onProgress);
   }
 
   /**
@@ -484,19 +582,38 @@ export class WorkoutScanner {
     file: File,
     onProgress?: (progress: ScanProgress) => void
   ): Promise<ScanResult> {
-    return new Promise((resolve, reject) => {
-      const video = document.createElement('video');
-      video.preload = 'metadata';
-      
+    const video = document.createElement('video');
+    video.preload = 'metadata';
+    const videoUrl = URL.createObjectURL(file);
+
+    return new Promise<ScanResult>((resolve, reject) => {
       video.onloadedmetadata = async () => {
         try {
+          await this.ensureWorkerPool(onProgress);
+
           const duration = video.duration;
           const fps = 30; // Assume 30fps
           const sampleInterval = 0.5; // Sample every 0.5 seconds
           const totalSamples = Math.floor(duration / sampleInterval);
+
+          // Downscale large frames before recognition
+          const frameScale = Math.min(1, MAX_OCR_FRAME_DIMENSION / Math.max(video.videoWidth, video.videoHeight));
+          const frameWidth = Math.round(video.videoWidth * frameScale);
+          const frameHeight = Math.round(video.videoHeight * frameScale);
           
-          const canvas = document.createElement('canvas');
-          const ctx = canvas.getContext('2d')!;
+          // One canvas per OCR worker, so a frame can be captured while the
+          // previous ones are still being recognized
+          const canvases = Array.from({ length: this.workerCount }, () => document.createElement('canvas'));
+          const contexts = canvases.map(canvas => canvas.getContext('2d')!);
+          const pending: Promise<void>[] = [];
+          const frameTexts: string[] = new Array(totalSamples).fill('');
+
+          // Thumbnail canvas for frame hashing
+          const hashCanvas = document.createElement('canvas');
+          hashCanvas.width = FRAME_DETAIL_HASH_SIZE + 1;
+          hashCanvas.height = FRAME_DETAIL_HASH_SIZE;
+          const hashCtx = hashCanvas.getContext('2d', { willReadFrequently: true })!;
+          const frameDeduplicator = new FrameDeduplicator();
           
           const allText: string[] = [];
           let processedFrames = 0;
@@ -510,60 +627,100 @@ export class WorkoutScanner {
               video.onseeked = resolve;
             });
 
-            // Draw frame to canvas
-            canvas.width = video.videoWidth;
-            canvas.height = video.videoHeight;
-            ctx.drawImage(video, 0, 0);
-
             onProgress?.({
               status: 'processing',
               progress: Math.round((i / totalSamples) * 100),
               message: `Processing frame ${i + 1}/${totalSamples}...`
             });
 
+            // Skip frames showing the same screen as the last recognized one,
+            // or exactly a screen seen earlier in the video (e.g. after scrolling back)
+            if (frameDeduplicator.isRepeat(computeFrameHash(hashCtx, video))) {
+              continue;
+            }
+            if (frameDeduplicator.isSeenBefore(computeFrameHash(hashCtx, video, FRAME_DETAIL_HASH_SIZE))) {
+              continue;
+            }
+
+            const slot = processedFrames % canvases.length;
+            const canvas = canvases[slot];
+            const ctx = contexts[slot];
+
+            // Wait for this canvas's previous frame to finish OCR before reusing it
+            await pending[slot];
+
+            // Draw frame to canvas
+            canvas.width = frameWidth;
+            canvas.height = frameHeight;
+            ctx.drawImage(video, 0, 0, frameWidth, frameHeight);
+
             // Extract text from frame
-            const text = await this.extractText(canvas);
+            pending[slot] = this.extractText(canvas).then(text => {
+              frameTexts[i] = text;
+            });
+            processedFrames++;
+          }
+
+          await Promise.all(pending);
 
-            if (text.trim()) {
+          // Keep frame order regardless of which worker finished first
+          for (const text of frameTexts) {
+            if (/\S/.test(text)) {
               allText.push(text);
             }
-            processedFrames++;
           }
 
           // Combine all text
           const combinedText = allText.join('\n');
 
-          onProgress?.({
-            status: 'processing',
-            progress: 100,
-            message: 'Parsing workout data...'
-          });
-
-          // Parse workout
-          const { exercises, format } = this.parseWorkoutText(combinedText);
-
-          // Match exercises to database
-          const matchedExercises = await this.matchExercises(exercises);
-
-          resolve({
-            source: file.name,
-            source_type: 'video',
-            detected_format: format as any,
-            total_exercises: matchedExercises.length,
-            timestamp: new Date().toISOString(),
-            exercises: matchedExercises,
-            raw_text: combinedText
-          });
+          resolve(await this.buildScanResult(file.name, 'video', combinedText, onProgress));
         } catch (error) {
           reject(error);
         }
       };
 
       video.onerror = () => reject(new Error('Failed to load video'));
-      video.src = URL.createObjectURL(file);
+      video.src = videoUrl;
+    }).finally(() => {
+      // Release the blob URL and decoder buffers once scanning finishes
+      video.removeAttribute('src');
+      video.load();
+      URL.revokeObjectURL(videoUrl);
     });
   }
 
+  /**
+   * Helper: Parse extracted text and match it to the exercise database
+   */
+  private async buildScanResult(
+    source: string,
+    sourceType: ScanResult['source_type'],
+    text: string,
+    onProgress?: (progress: ScanProgress) => void
+  ): Promise<ScanResult> {
+    onProgress?.({
+      status: 'processing',
+      progress: 100,
+      message: 'Parsing workout data...'
+    });
+
+    // Parse workout
+    const { exercises, format } = this.parseWorkoutText(text);
+
+    // Match exercises to database
+    const matchedExercises = await this.matchExercises(exercises);
+
+    return {
+      source,
+      source_type: sourceType,
+      detected_format: format as any,
+      total_exercises: matchedExercises.length,
+      timestamp: new Date().toISOString(),
+      exercises: matchedExercises,
+      raw_text: text
+    };
+  }
+
   /**
    * Helper: Normalize exercise name
    */
@@ -581,30 +738,14 @@ export class WorkoutScanner {
   private looksLikeExercise(name: string): boolean {
     if (!name || name.length < 3) return false;
     
-    const keywords = [
-      // Equipment
-      'barbell', 'dumbbell', 'cable', 'machine', 'kettlebell', 'band',
-      // Exercise types
-      'squat', 'press', 'raise', 'curl', 'row', 'lunge', 'deadlift', 
-      'fly', 'pull', 'push', 'step', 'crunch', 'plank', 'extension',
-      'kickback', 'shrug', 'twist', 'bend', 'lift', 'dip',
-      // Body parts
-      'leg', 'chest', 'shoulder', 'back', 'bicep', 'tricep', 'arm',
-      'glute', 'hamstring', 'quad', 'calf', 'ab', 'core', 'hip',
-      // Common words
-      'bench', 'incline', 'decline', 'lateral', 'front', 'side',
-      'overhead', 'seated', 'standing', 'lying', 'prone', 'supine'
-    ];
-    
     const lowerName = name.toLowerCase();
     
     // Check if contains exercise keywords
-    const hasKeyword = keywords.some(k => lowerName.includes(k));
+    const hasKeyword = EXERCISE_KEYWORD_PATTERN.test(lowerName);
     
     // Or if it has 2+ words and looks exercise-like (not common words)
-    const commonWords = ['set', 'rep', 'rest', 'warm', 'cool', 'down', 'up', 'the', 'and', 'or'];
     const isMultiWord = name.split(/\s+/).length >= 2;
-    const notCommonPhrase = !commonWords.some(w => lowerName === w);
+    const notCommonPhrase = !COMMON_WORDS.has(lowerName);
     
     return (hasKeyword || isMultiWord) && notCommonPhrase;
   }
@@ -619,31 +760,42 @@ export class WorkoutScanner {
     console.log('[WorkoutScanner] Matching exercises to database...');
     console.log('[WorkoutScanner] Available exercises:', allExercises.length);
 
+    // Index lowercase names once so exact matches are a lookup, not a scan,
+    // and pre-split each name into a word set for the fuzzy passes
+    const exercisesByName = new Map<string, ExerciseDefinition>();
+    const indexedExercises = allExercises.map(ex => {
+      const name = ex.name.toLowerCase();
+      if (!exercisesByName.has(name)) {
+        exercisesByName.set(name, ex);
+      }
+      return { exercise: ex, name, words: new Set(name.split(/\s+/)) };
+    });
+
     for (const scanned of scannedExercises) {
       const scannedName = scanned.exercise.toLowerCase().trim();
       
       // Try exact match first
-      let match = allExercises.find(ex => 
-        ex.name.toLowerCase() === scannedName
-      );
+      let match = exercisesByName.get(scannedName);
 
       // Try fuzzy match (contains)
       if (!match) {
-        match = allExercises.find(ex => {
-          const dbName = ex.name.toLowerCase();
-          return dbName.includes(scannedName) || scannedName.includes(dbName);
-        });
+        match = indexedExercises.find(({ name }) =>
+          name.includes(scannedName) || scannedName.includes(name)
+        )?.exercise;
       }
 
       // Try word-by-word match
       if (!match) {
         const scannedWords = scannedName.split(/\s+/);
-        match = allExercises.find(ex => {
-          const dbWords = ex.name.toLowerCase().split(/\s+/);
+        const requiredOverlap = Math.min(2, scannedWords.length);
+        match = indexedExercises.find(({ words }) => {
           // Match if at least 2 words overlap
-          const overlap = scannedWords.filter(w => dbWords.includes(w));
-          return overlap.length >= Math.min(2, scannedWords.length);
-        });
+          let overlap = 0;
+          for (const word of scannedWords) {
+            if (words.has(word) && ++overlap >= requiredOverlap) return true;
+          }
+          return false;
+        })?.exercise;
       }
 
       if (match) {
@@ -27,6 +27,8 @@ vi.mock('@mediapipe/pose', () => ({
     setOptions: vi.fn(),
     onResults: vi.fn(),
     send: vi.fn(),
+    reset: vi.fn(),
+    initialize: vi.fn(() => Promise.resolve()),
     close: vi.fn(),
   })),
   POSE_LANDMARKS: {},
@@ -43,6 +45,13 @@ vi.mock('tesseract.js', () => ({
     })),
     terminate: vi.fn(() => Promise.resolve()),
   })),
+  createScheduler: vi.fn(() => ({
+    addWorker: vi.fn(),
+    addJob: vi.fn(() => Promise.resolve({
+      data: { text: 'Mocked OCR text' }
+    })),
+    terminate: vi.fn(() => Promise.resolve()),
+  })),
   PSM: {
     AUTO: 3,
   },
@@ -421,6 +421,29 @@ describe('exerciseMetrics', () => {
       expect(movingAvg.add(40)).toBe(30); // (20 + 30 + 40) / 3
     });
 
+    it('should keep averaging the latest window after several wraps', () => {
+      for (let value = 1; value <= 10; value++) {
+        movingAvg.add(value);
+      }
+      expect(movingAvg.getAverage()).toBe(9); // (8 + 9 + 10) / 3
+      expect(movingAvg.add(2)).toBe(7); // (9 + 10 + 2) / 3
+    });
+
+    it('should treat a zero or negative window size as a single value', () => {
+      for (const size of [0, -3]) {
+        const avg = new MovingAverage(size);
+        expect(avg.add(10)).toBe(10);
+        expect(avg.add(20)).toBe(20);
+      }
+    });
+
+    it('should round a fractional window size down', () => {
+      const avg = new MovingAverage(2.7);
+      avg.add(10);
+      avg.add(20);
+      expect(avg.add(30)).toBe(25); // (20 + 30) / 2
+    });
+
     it('should handle custom window size', () => {
       const customAvg = new MovingAverage(5);
       customAvg.add(10);
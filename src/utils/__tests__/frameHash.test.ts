@@ -0,0 +1,172 @@
+import { describe, it, expect, vi } from 'vitest';
+import {
+  computeFrameHash,
+  hashDistance,
+  FrameDeduplicator,
+  FRAME_HASH_SIZE,
+  FRAME_HASH_MAX_DISTANCE,
+  FRAME_DETAIL_HASH_SIZE,
+} from '../frameHash';
+
+const source = {} as CanvasImageSource;
+
+// Context stub returning a grayscale thumbnail, one brightness value per pixel
+function thumbnailContext(rows: number[][]): CanvasRenderingContext2D {
+  const data = new Uint8ClampedArray(rows.length * rows[0].length * 4);
+  rows.flat().forEach((value, i) => {
+    data.set([value, value, value, 255], i * 4);
+  });
+  return {
+    drawImage: vi.fn(),
+    getImageData: vi.fn(() => ({ data })),
+  } as unknown as CanvasRenderingContext2D;
+}
+
+// Name widths, in thumbnail cells, of the items in a scrolling workout list
+const NAME_WIDTHS = [5, 9, 7, 12, 4, 10, 6, 11];
+
+// One list item per thumbnail row: dark text up to the name width on a light background
+function listScreen(firstItem: number): number[][] {
+  return Array.from({ length: FRAME_HASH_SIZE }, (_, y) => {
+    const nameWidth = NAME_WIDTHS[(firstItem + y) % NAME_WIDTHS.length];
+    return Array.from({ length: FRAME_HASH_SIZE + 1 }, (_, x) => (x < nameWidth ? 30 : 230));
+  });
+}
+
+// Context stub that renders a list page at whatever thumbnail size is read.
+// Each row's name covers the given fraction of the screen width
+function pageContext(nameWidths: number[]): CanvasRenderingContext2D {
+  return {
+    drawImage: vi.fn(),
+    getImageData: vi.fn((_x: number, _y: number, width: number, height: number) => {
+      const data = new Uint8ClampedArray(width * height * 4);
+      for (let y = 0; y < height; y++) {
+        const nameWidth = nameWidths[Math.floor((y / height) * nameWidths.length)];
+        for (let x = 0; x < width; x++) {
+          const value = (x + 0.5) / width < nameWidth ? 30 : 230;
+          data.set([value, value, value, 255], (y * width + x) * 4);
+        }
+      }
+      return { data };
+    }),
+  } as unknown as CanvasRenderingContext2D;
+}
+
+// Mirrors the per-frame decision in WorkoutScanner.processVideo
+function keepFrame(deduplicator: FrameDeduplicator, ctx: CanvasRenderingContext2D): boolean {
+  if (deduplicator.isRepeat(computeFrameHash(ctx, source))) {
+    return false;
+  }
+  return !deduplicator.isSeenBefore(computeFrameHash(ctx, source, FRAME_DETAIL_HASH_SIZE));
+}
+
+function flipBits(hash: Uint8Array, count: number, start = 0): Uint8Array {
+  const flipped = hash.slice();
+  for (let i = start; i < start + count; i++) {
+    flipped[i] ^= 1;
+  }
+  return flipped;
+}
+
+describe('frameHash', () => {
+  describe('computeFrameHash', () => {
+    it('should hash a 17x16 thumbnail into 256 bits', () => {
+      const ctx = thumbnailContext(listScreen(0));
+
+      const hash = computeFrameHash(ctx, source);
+
+      expect(ctx.drawImage).toHaveBeenCalledWith(source, 0, 0, FRAME_HASH_SIZE + 1, FRAME_HASH_SIZE);
+      expect(ctx.getImageData).toHaveBeenCalledWith(0, 0, FRAME_HASH_SIZE + 1, FRAME_HASH_SIZE);
+      expect(hash).toHaveLength(FRAME_HASH_SIZE * FRAME_HASH_SIZE);
+    });
+
+    it('should set a bit where brightness increases from the left neighbour', () => {
+      const hash = computeFrameHash(thumbnailContext(listScreen(0)), source);
+
+      // First row: dark up to x = 5, so the only increase is between x = 4 and x = 5
+      const firstRow = Array.from(hash.subarray(0, FRAME_HASH_SIZE));
+      expect(firstRow.indexOf(1)).toBe(NAME_WIDTHS[0] - 1);
+      expect(firstRow.filter(bit => bit === 1)).toHaveLength(1);
+    });
+
+    it('should give identical frames identical hashes', () => {
+      const first = computeFrameHash(thumbnailContext(listScreen(2)), source);
+      const second = computeFrameHash(thumbnailContext(listScreen(2)), source);
+
+      expect(hashDistance(first, second)).toBe(0);
+    });
+  });
+
+  describe('hashDistance', () => {
+    it('should count differing bits', () => {
+      const hash = new Uint8Array(FRAME_HASH_SIZE * FRAME_HASH_SIZE);
+
+      expect(hashDistance(hash, flipBits(hash, 3))).toBe(3);
+      expect(hashDistance(hash, flipBits(hash, 256))).toBe(256);
+    });
+  });
+
+  describe('FrameDeduplicator', () => {
+    it('should keep the first frame', () => {
+      const deduplicator = new FrameDeduplicator();
+
+      expect(deduplicator.isRepeat(computeFrameHash(thumbnailContext(listScreen(0)), source))).toBe(false);
+    });
+
+    it('should skip frames within the distance threshold of the last kept frame', () => {
+      const deduplicator = new FrameDeduplicator();
+      const hash = computeFrameHash(thumbnailContext(listScreen(0)), source);
+      deduplicator.isRepeat(hash);
+
+      expect(deduplicator.isRepeat(hash.slice())).toBe(true);
+      expect(deduplicator.isRepeat(flipBits(hash, FRAME_HASH_MAX_DISTANCE))).toBe(true);
+      expect(deduplicator.isRepeat(flipBits(hash, FRAME_HASH_MAX_DISTANCE + 1))).toBe(false);
+    });
+
+    it('should compare against the last kept frame, not the last sampled one', () => {
+      const deduplicator = new FrameDeduplicator();
+      const hash = new Uint8Array(FRAME_HASH_SIZE * FRAME_HASH_SIZE);
+      deduplicator.isRepeat(hash);
+
+      // Small steps that are each skipped still add up to a new screen
+      expect(deduplicator.isRepeat(flipBits(hash, 3))).toBe(true);
+      expect(deduplicator.isRepeat(flipBits(hash, 6))).toBe(false);
+    });
+
+    it('should keep a workout list scrolled by one row', () => {
+      const deduplicator = new FrameDeduplicator();
+      const screen = computeFrameHash(thumbnailContext(listScreen(0)), source);
+      const scrolled = computeFrameHash(thumbnailContext(listScreen(1)), source);
+
+      deduplicator.isRepeat(screen);
+
+      expect(hashDistance(screen, scrolled)).toBeGreaterThan(FRAME_HASH_MAX_DISTANCE);
+      expect(deduplicator.isRepeat(scrolled)).toBe(false);
+    });
+
+    it('should skip a screen scrolled back to', () => {
+      const deduplicator = new FrameDeduplicator();
+      const firstPage = pageContext([0.3, 0.4, 0.3, 0.4]);
+      const secondPage = pageContext([0.7, 0.2, 0.8, 0.25]);
+
+      expect(keepFrame(deduplicator, firstPage)).toBe(true);
+      expect(keepFrame(deduplicator, secondPage)).toBe(true);
+      expect(keepFrame(deduplicator, firstPage)).toBe(false);
+    });
+
+    it('should keep a later page whose layout matches an earlier one on the coarse grid', () => {
+      const deduplicator = new FrameDeduplicator();
+      // Names a little longer than the first page's: the same cells on the
+      // 16x16 grid, different cells on the 32x32 grid
+      const firstPage = pageContext([0.3, 0.4, 0.3, 0.4]);
+      const secondPage = pageContext([0.7, 0.2, 0.8, 0.25]);
+      const thirdPage = pageContext([0.32, 0.42, 0.32, 0.42]);
+
+      expect(hashDistance(computeFrameHash(firstPage, source), computeFrameHash(thirdPage, source))).toBe(0);
+
+      expect(keepFrame(deduplicator, firstPage)).toBe(true);
+      expect(keepFrame(deduplicator, secondPage)).toBe(true);
+      expect(keepFrame(deduplicator, thirdPage)).toBe(true);
+    });
+  });
+});
@@ -15,6 +15,8 @@ export interface PoseLandmark {
   visibility?: number;
 }
 
+const RAD_TO_DEG = 180 / Math.PI;
+
 /**
  * Calculate angle at point B formed by points A-B-C
  * @param pointA First point
@@ -27,36 +29,27 @@ export function calculateAngle(
   pointB: Point3D,
   pointC: Point3D
 ): number {
-  // Vector from B to A
-  const ba = {
-    x: pointA.x - pointB.x,
-    y: pointA.y - pointB.y,
-    z: pointA.z - pointB.z,
-  };
-
-  // Vector from B to C
-  const bc = {
-    x: pointC.x - pointB.x,
-    y: pointC.y - pointB.y,
-    z: pointC.z - pointB.z,
-  };
+  // Vectors from B to A and from B to C, kept as scalars to avoid allocating per call
+  const baX = pointA.x - pointB.x;
+  const baY = pointA.y - pointB.y;
+  const baZ = pointA.z - pointB.z;
+  const bcX = pointC.x - pointB.x;
+  const bcY = pointC.y - pointB.y;
+  const bcZ = pointC.z - pointB.z;
 
   // Calculate dot product
-  const dotProduct = ba.x * bc.x + ba.y * bc.y + ba.z * bc.z;
+  const dotProduct = baX * bcX + baY * bcY + baZ * bcZ;
 
-  // Calculate magnitudes
-  const magnitudeBA = Math.sqrt(ba.x * ba.x + ba.y * ba.y + ba.z * ba.z);
-  const magnitudeBC = Math.sqrt(bc.x * bc.x + bc.y * bc.y + bc.z * bc.z);
+  // Calculate cosine of angle (one square root for both magnitudes)
+  const cosineAngle = dotProduct / Math.sqrt(
+    (baX * baX + baY * baY + baZ * baZ) * (bcX * bcX + bcY * bcY + bcZ * bcZ)
+  );
 
-  // Calculate cosine of angle
-  const cosineAngle = dotProduct / (magnitudeBA * magnitudeBC);
-
-  // Clamp to valid range for arccos
-  const clampedCosine = Math.max(-1.0, Math.min(1.0, cosineAngle));
+  // Clamp to valid range for arccos (plain comparisons keep NaN as NaN)
+  const clampedCosine = cosineAngle > 1.0 ? 1.0 : cosineAngle < -1.0 ? -1.0 : cosineAngle;
 
   // Calculate angle in radians then convert to degrees
-  const angleRadians = Math.acos(clampedCosine);
-  return (angleRadians * 180) / Math.PI;
+  return Math.acos(clampedCosine) * RAD_TO_DEG;
 }
 
 /**
@@ -192,31 +185,53 @@ export function clamp(value: number, min: number, max: number): number {
 }
 
 /**
- * Moving average filter for smoothing measurements
+ * Moving average filter for smoothing measurements.
+ * Values are kept in a fixed ring buffer with a running sum, so each update
+ * is O(1) instead of shifting the array and re-summing the window.
  */
 export class MovingAverage {
-  private values: number[] = [];
+  private values: Float64Array;
   private windowSize: number;
+  private count = 0;
+  private nextIndex = 0;
+  private sum = 0;
 
   constructor(windowSize: number = 5) {
-    this.windowSize = windowSize;
+    // The ring buffer needs a whole, positive size
+    this.windowSize = Math.max(1, Math.floor(windowSize));
+    this.values = new Float64Array(this.windowSize);
   }
 
   add(value: number): number {
-    this.values.push(value);
-    if (this.values.length > this.windowSize) {
-      this.values.shift();
+    if (this.count === this.windowSize) {
+      this.sum -= this.values[this.nextIndex];
+    } else {
+      this.count++;
+    }
+    this.values[this.nextIndex] = value;
+    this.sum += value;
+
+    this.nextIndex = (this.nextIndex + 1) % this.windowSize;
+    // Re-sum once per lap, and while a non-finite value is involved, so rounding
+    // error or a NaN that has left the window cannot linger in the running sum
+    if (this.nextIndex === 0 || !Number.isFinite(this.sum)) {
+      this.sum = 0;
+      for (let i = 0; i < this.count; i++) {
+        this.sum += this.values[i];
+      }
     }
+
     return this.getAverage() || 0;
   }
 
   reset(): void {
-    this.values = [];
+    this.count = 0;
+    this.nextIndex = 0;
+    this.sum = 0;
   }
 
   getAverage(): number | null {
-    if (this.values.length === 0) return null;
-    const sum = this.values.reduce((acc, val) => acc + val, 0);
-    return sum / this.values.length;
+    if (this.count === 0) return null;
+    return this.sum / this.count;
   }
 }
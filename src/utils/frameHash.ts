@@ -0,0 +1,94 @@
+/**
+ * Frame fingerprinting for skipping repeated video frames before OCR
+ */
+
+// Frames are fingerprinted with a difference hash (dHash) over a 16x16 grid:
+// a 17x16 grayscale thumbnail, one bit per horizontally adjacent pixel pair
+export const FRAME_HASH_SIZE = 16;
+
+// Largest number of differing bits (out of 256) for two frames to count as
+// the same screen. This only absorbs video compression noise: scrolling a
+// workout list by one row moves every row's light/dark edges, which flips far
+// more bits than this, so a new screen with the same layout is still read
+export const FRAME_HASH_MAX_DISTANCE = 4;
+
+// Grid for the finer hash used to recognize a screen seen earlier in the
+// video. Unlike the last-frame check this needs an exact match, and the 32x32
+// grid (1024 bits) separates list pages that share a layout but list
+// different exercises
+export const FRAME_DETAIL_HASH_SIZE = 32;
+
+/**
+ * Compute the difference hash of a frame, 1 per grid cell where brightness
+ * increases from its left neighbour. The context must be at least
+ * (size + 1) x size pixels.
+ */
+export function computeFrameHash(
+  ctx: CanvasRenderingContext2D,
+  source: CanvasImageSource,
+  size: number = FRAME_HASH_SIZE
+): Uint8Array {
+  const width = size + 1;
+  ctx.drawImage(source, 0, 0, width, size);
+  const data = ctx.getImageData(0, 0, width, size).data;
+  const hash = new Uint8Array(size * size);
+
+  let bit = 0;
+  for (let y = 0; y < size; y++) {
+    let offset = y * width * 4;
+    let previous = data[offset] * 0.299 + data[offset + 1] * 0.587 + data[offset + 2] * 0.114;
+    for (let x = 1; x < width; x++) {
+      offset += 4;
+      const current = data[offset] * 0.299 + data[offset + 1] * 0.587 + data[offset + 2] * 0.114;
+      hash[bit++] = current > previous ? 1 : 0;
+      previous = current;
+    }
+  }
+
+  return hash;
+}
+
+/**
+ * Number of differing bits between two frame hashes
+ */
+export function hashDistance(a: Uint8Array, b: Uint8Array): number {
+  let distance = 0;
+  for (let i = 0; i < a.length; i++) {
+    if (a[i] !== b[i]) distance++;
+  }
+  return distance;
+}
+
+/**
+ * Tracks the frames kept for OCR and reports frames showing a screen already read
+ */
+export class FrameDeduplicator {
+  private lastHash: Uint8Array | null = null;
+  private seenDetailHashes = new Set<string>();
+
+  /**
+   * Check whether a frame repeats the last kept one. Frames that do not
+   * become the new reference.
+   */
+  isRepeat(hash: Uint8Array): boolean {
+    if (this.lastHash && hashDistance(hash, this.lastHash) <= FRAME_HASH_MAX_DISTANCE) {
+      return true;
+    }
+    this.lastHash = hash;
+    return false;
+  }
+
+  /**
+   * Check whether any earlier kept frame had exactly this detail hash
+   * (FRAME_DETAIL_HASH_SIZE grid), e.g. after scrolling back. Frames that
+   * did not are remembered for the rest of the scan.
+   */
+  isSeenBefore(detailHash: Uint8Array): boolean {
+    const key = detailHash.join('');
+    if (this.seenDetailHashes.has(key)) {
+      return true;
+    }
+    this.seenDetailHashes.add(key);
+    return false;
+  }
+}